@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Indexed asset pack: pre-decoded pixels and PCM in a single memory-mapped file
+
+Run `python assetpack.py` before `python setup.py build` to write
+assets/runtime.pack from the images in assets/bake_manifest.json and every sound
+in the sound bank. At startup the pack is mapped once; images become surfaces
+through pygame.image.frombuffer and sounds through pygame.sndarray, with no
+per-file open or decode. Frozen builds ship the pack instead of assets/.
+
+Sounds are packed once whatever the mixer format: synthesized PCM doesn't depend
+on it, and decoded files are converted to the running mixer's format on load.
+"""
+import pygame
+import numpy as np
+import inspect
+import json
+import mmap
+import os
+import struct
+import sys
+from constants import assets_dir
+from bake import manifest_path, transform_image, source_name, entry_key, \
+    source_record, is_fresh
+
+PACK_MAGIC = b"SVIPACK\0"
+# Bump when the pack layout changes
+PACK_VERSION = 2
+pack_path = os.path.join(assets_dir, "runtime.pack")
+# Blobs start on this boundary so numpy and SDL get aligned buffers
+ALIGNMENT = 16
+_HEADER = struct.Struct("<8sII")  # magic, version, index length
+
+_pack = None
+
+# Mixer sample size (as in pygame.mixer.get_init()) -> numpy sample type; 32-bit
+# samples are always float
+_SAMPLE_TYPES = {8: np.uint8, -8: np.int8, 16: np.uint16, -16: np.int16,
+                 32: np.float32, -32: np.float32}
+
+def _is_frozen():
+    return getattr(sys, "frozen", False)
+
+def _data_start(index_length):
+    """Blob offsets in the index are relative to the aligned end of the index"""
+    end = _HEADER.size + index_length
+    return end + (-end % ALIGNMENT)
+
+class AssetPack:
+    """Read-only view of a pack file; the mapping stays open for the process lifetime"""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = _HEADER.unpack_from(self.data, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} asset pack")
+        self.index = json.loads(self.data[_HEADER.size:_HEADER.size + index_length])
+        self.data_start = _data_start(index_length)
+        self.view = memoryview(self.data)
+
+    def image(self, path, size=None, rotation=0):
+        """Surface for an image variant, or None if the pack lacks it or it is stale"""
+        entry = self.index["images"].get(entry_key(source_name(path), size, rotation))
+        if entry is None:
+            return None
+        # In a development tree the sources must still match the pack
+        if not _is_frozen() and not is_fresh(entry, path):
+            return None
+        width, height = entry["size"]
+        offset = self.data_start + entry["offset"]
+        buffer = self.view[offset:offset + width * height * 4]
+        return pygame.image.frombuffer(buffer, (width, height), "RGBA")
+
+    def samples(self, key, fingerprint=None, source_path=None):
+        """PCM array for a sound entry, or None if it is missing or stale.
+
+        Synthesized sounds are checked against their generator fingerprint and
+        decoded files against their source, except in frozen builds where the
+        pack is all there is.
+        """
+        entry = self.index["sounds"].get(key)
+        if entry is None:
+            return None
+        if not _is_frozen():
+            if fingerprint is not None and fingerprint != entry.get("fingerprint"):
+                return None
+            if source_path is not None and not is_fresh(entry, source_path):
+                return None
+        shape = tuple(entry["shape"])
+        return np.frombuffer(self.data, dtype=entry["dtype"], count=int(np.prod(shape)),
+                             offset=self.data_start + entry["offset"]).reshape(shape)
+
+def get_pack():
+    """The runtime pack, or None if there isn't a usable one"""
+    global _pack
+    if _pack is None:
+        try:
+            _pack = AssetPack(pack_path)
+        except (OSError, ValueError) as e:
+            if os.path.exists(pack_path):
+                print(f"Ignoring asset pack: {e}")
+            _pack = False
+    return _pack or None
+
+def synthesized_key(name, arguments):
+    return f"{name}|{sorted(arguments.items())!r}"
+
+def file_sound_key(path):
+    return source_name(path)
+
+def _to_float(samples, size):
+    """PCM of a mixer sample size as floats in [-1, 1]"""
+    if abs(size) == 32:
+        return samples.astype(np.float64)
+    scale = float(2 ** (abs(size) - 1))
+    if size > 0:  # Unsigned samples are centered on half their range
+        return (samples.astype(np.float64) - scale) / scale
+    return samples.astype(np.float64) / scale
+
+def _from_float(samples, size):
+    samples = np.clip(samples, -1.0, 1.0)
+    if abs(size) == 32:
+        return samples.astype(np.float32)
+    scale = 2 ** (abs(size) - 1)
+    samples = np.rint(samples * scale)
+    if size > 0:
+        samples += scale
+    info = np.iinfo(_SAMPLE_TYPES[size])
+    return np.clip(samples, info.min, info.max).astype(_SAMPLE_TYPES[size])
+
+def convert_samples(samples, source_format, mixer_format):
+    """Resample and reformat PCM decoded for one mixer format to suit another.
+
+    Formats are (frequency, size, channels) as returned by pygame.mixer.get_init().
+    Channel counts that differ are mixed down to mono and spread back out.
+    """
+    if tuple(source_format) == tuple(mixer_format):
+        return samples
+    source_frequency, source_size, source_channels = source_format
+    frequency, size, channels = mixer_format
+    data = _to_float(samples, source_size).reshape(len(samples), source_channels)
+
+    if source_frequency != frequency:
+        frames = max(1, round(len(data) * frequency / source_frequency))
+        positions = np.arange(frames) * (source_frequency / frequency)
+        source_positions = np.arange(len(data))
+        data = np.stack([np.interp(positions, source_positions, data[:, channel])
+                         for channel in range(source_channels)], axis=1)
+    if source_channels != channels:
+        data = np.repeat(data.mean(axis=1, keepdims=True), channels, axis=1)
+
+    data = _from_float(data, size)
+    return data[:, 0].copy() if channels == 1 else np.ascontiguousarray(data)
+
+def load_packed_image(path, size=None, rotation=0):
+    pack = get_pack()
+    return pack.image(path, size, rotation) if pack else None
+
+def load_packed_samples(key, fingerprint=None, source_path=None):
+    pack = get_pack()
+    return pack.samples(key, fingerprint, source_path) if pack else None
+
+def load_packed_sound(path):
+    """Sound for a sound file decoded at build time, or None if the pack lacks it"""
+    pack = get_pack()
+    samples = pack.samples(file_sound_key(path), source_path=path) if pack else None
+    if samples is None:
+        return None
+    source_format = pack.index["sounds"][file_sound_key(path)]["format"]
+    return pygame.sndarray.make_sound(
+        convert_samples(samples, source_format, pygame.mixer.get_init()))
+
+def build_pack(manifest=manifest_path, path=pack_path):
+    """Decode every manifest image and render every sound bank entry into a pack"""
+    import display
+    from audio import shoot_sound_path
+    from soundbank import SOUND_SPECS
+    from soundcache import generator_fingerprint
+
+    display.init(headless=True)
+    mixer_format = pygame.mixer.get_init()
+    blobs = []
+    index = {"images": {}, "sounds": {}}
+
+    def add_blob(data):
+        offset = sum(len(blob) for blob in blobs)
+        blobs.append(data + b"\0" * (-len(data) % ALIGNMENT))
+        return offset
+
+    with open(manifest, "r") as f:
+        entries = json.load(f)
+    sources = {}
+    for item in entries:
+        source = item["source"]
+        size = tuple(item["size"]) if item.get("size") else None
+        rotation = item.get("rotation", 0)
+        source_path = os.path.join(assets_dir, source)
+        if source not in sources:
+            sources[source] = pygame.image.load(source_path)
+        image = transform_image(sources[source], size, rotation)
+        key = entry_key(source, size, rotation)
+        index["images"][key] = {
+            "offset": add_blob(pygame.image.tobytes(image, "RGBA")),
+            "size": list(image.get_size()),
+            **source_record(source_path),
+        }
+        print(f"Packed {key}")
+
+    for name, factory, _ in SOUND_SPECS:
+        if hasattr(factory, "render"):
+            bound = inspect.signature(factory.generator).bind()
+            bound.apply_defaults()
+            samples = factory.render(mixer_format=mixer_format)
+            key = synthesized_key(factory.generator.__name__, bound.arguments)
+            extra = {"fingerprint": generator_fingerprint(factory.generator)}
+        else:
+            # Plain sound files are decoded by the mixer once, here, and
+            # converted if the game's mixer ends up with another format
+            samples = pygame.sndarray.array(pygame.mixer.Sound(shoot_sound_path))
+            key = file_sound_key(shoot_sound_path)
+            extra = {**source_record(shoot_sound_path), "format": list(mixer_format)}
+        if samples is None:
+            continue
+        samples = np.ascontiguousarray(samples)
+        index["sounds"][key] = {"offset": add_blob(samples.tobytes()),
+                                "shape": list(samples.shape), "dtype": samples.dtype.str,
+                                **extra}
+        print(f"Packed {name}")
+
+    index_bytes = json.dumps(index).encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (_data_start(len(index_bytes)) - f.tell()))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+    print(f"Wrote {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+    return index
+
+if __name__ == "__main__":
+    build_pack()
@@ -0,0 +1,122 @@
+"""
+Texture atlas: small runtime sprite images packed into a few large surfaces
+
+Sprites get subsurfaces of the atlas pages instead of surfaces of their own, so
+the pixels live in a handful of allocations and sprite groups blit from the same
+few sources.
+"""
+import pygame
+import threading
+from registry import registry
+
+# Side of a regular atlas page; larger images get a page of their own
+PAGE_SIZE = 512
+# Transparent gap between regions so scaling/rotating a region never picks up a neighbour
+PADDING = 1
+
+class TextureAtlas:
+    """Shelf-packs surfaces into shared pages and hands out subsurfaces by key.
+
+    Subsurfaces returned by get() are shared, like registry surfaces, and must be
+    treated as read-only. view() returns a separate subsurface of the same pixels
+    for sprites that change their own alpha.
+    """
+    def __init__(self, page_size=PAGE_SIZE, padding=PADDING, category="sprites"):
+        self.page_size = page_size
+        self.padding = padding
+        self.category = category  # what the pages count as in the registry's memory report
+        self.pages = []
+        self.shelves = []   # per page: list of [y, height, next_x]
+        self.regions = {}   # key -> (page index, rect)
+        self.surfaces = {}  # key -> shared subsurface
+        # The boot loader packs while the main thread may add frames too. Blits from
+        # the pages aren't covered, so the boot loader finishes packing before play
+        self.lock = threading.RLock()
+
+    def _new_page(self, width, height):
+        page = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            page = page.convert_alpha()
+        page.fill((0, 0, 0, 0))
+        self.pages.append(registry.track(page, self.category))
+        self.shelves.append([])
+        return len(self.pages) - 1
+
+    def _allocate(self, width, height):
+        """Find room for a width x height region; returns (page index, rect)"""
+        w, h = width + self.padding, height + self.padding
+        for index, shelves in enumerate(self.shelves):
+            page_width, page_height = self.pages[index].get_size()
+            for shelf in shelves:
+                y, shelf_height, next_x = shelf
+                if h <= shelf_height and next_x + w <= page_width:
+                    shelf[2] += w
+                    return index, pygame.Rect(next_x, y, width, height)
+            top = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if top + h <= page_height and w <= page_width:
+                shelves.append([top, h, w])
+                return index, pygame.Rect(0, top, width, height)
+
+        index = self._new_page(max(self.page_size, w), max(self.page_size, h))
+        self.shelves[index].append([0, h, w])
+        return index, pygame.Rect(0, 0, width, height)
+
+    def add(self, key, surface):
+        """Copy a surface into the atlas (once per key) and return its shared subsurface"""
+        with self.lock:
+            if key in self.surfaces:
+                return self.surfaces[key]
+            index, rect = self._allocate(*surface.get_size())
+            # The region is still fully transparent, so MAX copies the pixels exactly,
+            # alpha included, where a normal blit would blend them
+            self.pages[index].blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            return self._register(key, index, rect)
+
+    def _register(self, key, index, rect):
+        self.regions[key] = (index, rect)
+        self.surfaces[key] = self.pages[index].subsurface(rect)
+        return self.surfaces[key]
+
+    def get(self, key):
+        return self.surfaces[key]
+
+    def __contains__(self, key):
+        return key in self.surfaces
+
+    def view(self, key):
+        """A new subsurface of a region; it shares pixels but has its own alpha"""
+        index, rect = self.regions[key]
+        return self.pages[index].subsurface(rect)
+
+    def region(self, key):
+        """(page surface, source rect) of a region, for blits() batches"""
+        index, rect = self.regions[key]
+        return self.pages[index], rect
+
+    def dot(self, color, radius, size=None):
+        """A filled circle of the given color and radius, drawn into the atlas once.
+
+        The circle sits at (radius, radius) in a size x size region (default
+        2 * radius), matching the particle surfaces the effects used to draw.
+        """
+        size = radius * 2 if size is None else size
+        key = ("dot", tuple(color), radius, size)
+        with self.lock:
+            if key not in self.surfaces:
+                index, rect = self._allocate(size, size)
+                self._register(key, index, rect)
+                pygame.draw.circle(self.surfaces[key], color, (radius, radius), radius)
+            return self.view(key)
+
+    def memory_bytes(self):
+        return sum(page.get_pitch() * page.get_height() for page in self.pages)
+
+    def clear(self):
+        with self.lock:
+            self.pages.clear()
+            self.shelves.clear()
+            self.regions.clear()
+            self.surfaces.clear()
+
+# Holds every sprite image used during play
+sprite_atlas = TextureAtlas()
@@ -6,18 +6,23 @@ import numpy as np
 import os
 import random
 from constants import assets_dir
+from soundcache import synthesized
+from assetpack import load_packed_sound
+
+shoot_sound_path = os.path.join(assets_dir, "bark_shoot_converted.wav")
 
 # Load shooting sound
 def load_shoot_sound():
-    """Load the bark shooting sound"""
+    """Load the bark shooting sound, already decoded if the asset pack has it"""
     try:
-        shoot_sound = pygame.mixer.Sound(os.path.join(assets_dir, "bark_shoot_converted.wav"))
+        shoot_sound = load_packed_sound(shoot_sound_path) or pygame.mixer.Sound(shoot_sound_path)
         shoot_sound.set_volume(0.5)
         return shoot_sound
     except:
         print("Could not load bark shoot converted.wav")
         return None
 
+@synthesized
 def create_explosion_sound(duration=0.3, sample_rate=22050):
     """Create a sharp, punchy first explosion sound (80s arcade style)"""
     try:
@@ -50,11 +55,12 @@ def create_explosion_sound(duration=0.3, sample_rate=22050):
         stereo[:, 0] = explosion
         stereo[:, 1] = explosion
         
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create explosion sound: {e}")
         return None
 
+@synthesized
 def create_explosion_sound_2(duration=0.5, sample_rate=22050):
     """Create a deeper, bigger second explosion sound (80s arcade style)"""
     try:
@@ -98,11 +104,12 @@ def create_explosion_sound_2(duration=0.5, sample_rate=22050):
         delay = int(0.005 * sample_rate)
         stereo[delay:, 1] = explosion[:-delay]
         
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create explosion sound 2: {e}")
         return None
 
+@synthesized
 def create_80s_death_sound(duration=2.0, sample_rate=22050):
     """Create an 80s-style death sound effect"""
     try:
@@ -152,11 +159,12 @@ def create_80s_death_sound(duration=2.0, sample_rate=22050):
         delay_samples = int(0.002 * sample_rate)
         stereo_sound[delay_samples:, 1] = sound_80s[:-delay_samples]
         
-        return pygame.sndarray.make_sound(stereo_sound)
+        return stereo_sound
     except Exception as e:
         print(f"Could not create 80s death sound: {e}")
         return None
 
+@synthesized
 def create_particle_shrinking_sound(duration=3.0, sample_rate=22050):
     """Create 80s arcade particle shrinking/fading sound effect"""
     try:
@@ -244,11 +252,12 @@ def create_particle_shrinking_sound(duration=3.0, sample_rate=22050):
                 else:
                     stereo_sound[delay:, 1] += sound[:-delay] // (i + 2)
         
-        return pygame.sndarray.make_sound(stereo_sound)
+        return stereo_sound
     except Exception as e:
         print(f"Could not create particle shrinking sound: {e}")
         return None
 
+@synthesized
 def create_final_death_sound_80s(duration=0.5, sample_rate=22050):
     """Create a SHORT explosive 80s arcade death sound"""
     try:
@@ -281,11 +290,12 @@ def create_final_death_sound_80s(duration=0.5, sample_rate=22050):
         sound = (sound * 32767 * 0.9).astype(np.int16)
         
         stereo = np.stack([sound, sound], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create final death sound: {e}")
         return None
 
+@synthesized
 def create_80s_transition_music(duration=5.0, sample_rate=22050):
     """Create 80s-style transition music for game over sequence"""
     try:
@@ -381,11 +391,12 @@ def create_80s_transition_music(duration=5.0, sample_rate=22050):
         stereo_music[:, 0] = final_music
         stereo_music[:, 1] = final_music
         
-        return pygame.sndarray.make_sound(stereo_music)
+        return stereo_music
     except Exception as e:
         print(f"Could not create 80s transition music: {e}")
         return None
 
+@synthesized
 def create_game_over_music(duration=10.0, sample_rate=22050):
     """Create dramatic 80s game over screen music"""
     try:
@@ -436,11 +447,12 @@ def create_game_over_music(duration=10.0, sample_rate=22050):
         music = np.clip(music, -1, 1)
         music = (music * 32767 * 0.6).astype(np.int16)
         stereo = np.stack([music, music], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create game over music: {e}")
         return None
 
+@synthesized
 def create_typing_sound(sample_rate=22050):
     """Create 80s computer typing beep for high score entry"""
     try:
@@ -459,11 +471,12 @@ def create_typing_sound(sample_rate=22050):
         beep = np.clip(beep, -1, 1)
         beep = (beep * 32767 * 0.5).astype(np.int16)
         stereo = np.stack([beep, beep], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create typing sound: {e}")
         return None
 
+@synthesized
 def create_high_scores_music(duration=30.0, sample_rate=22050):
     """Create upbeat 80s music for high scores screen"""
     try:
@@ -515,11 +528,12 @@ def create_high_scores_music(duration=30.0, sample_rate=22050):
         music = np.clip(music, -1, 1)
         music = (music * 32767 * 0.5).astype(np.int16)
         stereo = np.stack([music, music], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create high scores music: {e}")
         return None
 
+@synthesized
 def create_transition_sweep(duration=0.5, sample_rate=22050):
     """Create 80s style transition sweep sound"""
     try:
@@ -549,11 +563,12 @@ def create_transition_sweep(duration=0.5, sample_rate=22050):
         sound = np.clip(sound, -1, 1)
         sound = (sound * 32767 * 0.7).astype(np.int16)
         stereo = np.stack([sound, sound], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create transition sweep: {e}")
         return None
 
+@synthesized
 def create_player_death_sound(duration=0.8, sample_rate=22050):
     """Create 80s arcade player death sound (for non-final deaths)"""
     try:
@@ -597,11 +612,12 @@ def create_player_death_sound(duration=0.8, sample_rate=22050):
         sound = (sound * 32767 * 0.7).astype(np.int16)
         
         stereo = np.stack([sound, sound], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create player death sound: {e}")
         return None
 
+@synthesized
 def create_wrong_answer_sound(duration=0.3, sample_rate=22050):
     """Create 80s style wrong answer buzzer"""
     try:
@@ -626,11 +642,12 @@ def create_wrong_answer_sound(duration=0.3, sample_rate=22050):
         buzzer = np.clip(buzzer, -1, 1)
         buzzer = (buzzer * 32767 * 0.5).astype(np.int16)
         stereo = np.stack([buzzer, buzzer], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create wrong answer sound: {e}")
         return None
 
+@synthesized
 def create_victory_fanfare(duration=2.0, sample_rate=22050):
     """Create 80s victory fanfare for correct answer"""
     try:
@@ -674,11 +691,12 @@ def create_victory_fanfare(duration=2.0, sample_rate=22050):
         fanfare = np.clip(fanfare, -1, 1)
         fanfare = (fanfare * 32767 * 0.6).astype(np.int16)
         stereo = np.stack([fanfare, fanfare], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create victory fanfare: {e}")
         return None
 
+@synthesized
 def create_shield_bounce_sound(duration=0.2, sample_rate=22050):
     """Create shield bounce sound effect"""
     try:
@@ -707,72 +725,7 @@ def create_shield_bounce_sound(duration=0.2, sample_rate=22050):
         sound = (sound * 32767 * 0.7).astype(np.int16)
         
         stereo = np.stack([sound, sound], axis=-1)
-        return pygame.sndarray.make_sound(stereo)
+        return stereo
     except Exception as e:
         print(f"Could not create shield bounce sound: {e}")
         return None
-
-def load_all_sounds():
-    """Load all game sounds"""
-    shoot_sound = load_shoot_sound()
-    explosion_sound = create_explosion_sound()
-    if explosion_sound:
-        explosion_sound.set_volume(0.7)
-    
-    explosion_sound_2 = create_explosion_sound_2()
-    if explosion_sound_2:
-        explosion_sound_2.set_volume(0.8)  # Louder for second explosion
-    
-    death_sound_80s = create_80s_death_sound()
-    if death_sound_80s:
-        death_sound_80s.set_volume(0.6)
-    
-    final_death_sound_80s = create_final_death_sound_80s()
-    if final_death_sound_80s:
-        final_death_sound_80s.set_volume(0.8)  # Louder for dramatic effect
-    
-    transition_music_80s = create_80s_transition_music()
-    if transition_music_80s:
-        transition_music_80s.set_volume(0.5)
-    
-    # New screen sounds
-    game_over_music = create_game_over_music()
-    if game_over_music:
-        game_over_music.set_volume(0.4)
-    
-    typing_sound = create_typing_sound()
-    if typing_sound:
-        typing_sound.set_volume(0.5)
-    
-    high_scores_music = create_high_scores_music()
-    if high_scores_music:
-        high_scores_music.set_volume(0.3)
-    
-    transition_sweep = create_transition_sweep()
-    if transition_sweep:
-        transition_sweep.set_volume(0.6)
-    
-    victory_fanfare = create_victory_fanfare()
-    if victory_fanfare:
-        victory_fanfare.set_volume(0.7)
-    
-    wrong_answer_sound = create_wrong_answer_sound()
-    if wrong_answer_sound:
-        wrong_answer_sound.set_volume(0.6)
-    
-    particle_shrinking_sound = create_particle_shrinking_sound()
-    if particle_shrinking_sound:
-        particle_shrinking_sound.set_volume(0.7)
-    
-    player_death_sound = create_player_death_sound()
-    if player_death_sound:
-        player_death_sound.set_volume(0.7)
-    
-    shield_bounce_sound = create_shield_bounce_sound()
-    if shield_bounce_sound:
-        shield_bounce_sound.set_volume(0.6)
-    
-    return (shoot_sound, explosion_sound, explosion_sound_2, death_sound_80s, transition_music_80s, 
-            final_death_sound_80s, game_over_music, typing_sound, high_scores_music,
-            transition_sweep, victory_fanfare, wrong_answer_sound, particle_shrinking_sound,
-            player_death_sound, shield_bounce_sound)
\ No newline at end of file
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Offline asset baking: pre-scaled, pre-rotated copies of oversized source images
+
+Run `python bake.py` after changing anything listed in assets/bake_manifest.json.
+Loaders use a baked copy only while its source image is unchanged and fall back
+to decoding the original otherwise.
+"""
+import pygame
+import hashlib
+import json
+import os
+from constants import assets_dir, cache_dir
+
+# Bump when baked files need to be regenerated regardless of their sources
+BAKE_VERSION = 1
+manifest_path = os.path.join(assets_dir, "bake_manifest.json")
+baked_dir = os.path.join(cache_dir, "baked", f"v{BAKE_VERSION}")
+index_path = os.path.join(baked_dir, "index.json")
+
+_index = None
+
+def transform_image(image, size=None, rotation=0):
+    """Scale and then rotate an image, the way every loader derives its surfaces"""
+    if size:
+        image = pygame.transform.scale(image, size)
+    if rotation:
+        image = pygame.transform.rotate(image, rotation)
+    return image
+
+def source_name(path):
+    """Name a source image relative to the assets directory when it lives there"""
+    path = os.path.abspath(path)
+    if os.path.dirname(path) == os.path.abspath(assets_dir):
+        return os.path.basename(path)
+    return path
+
+def entry_key(source, size, rotation):
+    """Index key of one variant of a source image, shared by baked files and the asset pack"""
+    size_text = f"{size[0]}x{size[1]}" if size else "source"
+    return f"{source}|{size_text}|{rotation % 360}"
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+def source_record(path):
+    """What an index entry stores about its source for is_fresh()"""
+    return {"stamp": _source_stamp(path), "sha1": _file_sha1(path)}
+
+def _load_index():
+    global _index
+    if _index is None:
+        try:
+            with open(index_path, "r") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+def is_fresh(entry, source_path):
+    """Check a baked or packed entry against its source: cheap stat first, content hash if that differs"""
+    try:
+        stamp = _source_stamp(source_path)
+    except OSError:
+        return False
+    if stamp == entry.get("stamp"):
+        return True
+    return stamp["size"] == entry.get("stamp", {}).get("size") and \
+        _file_sha1(source_path) == entry.get("sha1")
+
+def load_baked_image(path, size=None, rotation=0):
+    """Return the baked surface for (path, size, rotation), or None if missing or stale"""
+    entry = _load_index().get(entry_key(source_name(path), size, rotation))
+    if entry is None or not is_fresh(entry, path):
+        return None
+    try:
+        return pygame.image.load(os.path.join(baked_dir, entry["file"]))
+    except (pygame.error, OSError):
+        return None
+
+def bake_assets(manifest=manifest_path):
+    """Bake every image listed in the manifest and write the cache index"""
+    global _index
+    with open(manifest, "r") as f:
+        entries = json.load(f)
+
+    os.makedirs(baked_dir, exist_ok=True)
+    index = {}
+    sources = {}
+    for item in entries:
+        source = item["source"]
+        size = tuple(item["size"]) if item.get("size") else None
+        rotation = item.get("rotation", 0)
+        source_path = os.path.join(assets_dir, source)
+        key = entry_key(source, size, rotation)
+
+        # Decode each source only once however many variants it has
+        if source not in sources:
+            sources[source] = pygame.image.load(source_path)
+        image = transform_image(sources[source], size, rotation)
+
+        filename = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".png"
+        pygame.image.save(image, os.path.join(baked_dir, filename))
+        index[key] = {"file": filename, **source_record(source_path)}
+        print(f"Baked {key} -> {filename}")
+
+    # Remove files left over from manifest entries that no longer exist
+    keep = {entry["file"] for entry in index.values()} | {os.path.basename(index_path)}
+    for filename in os.listdir(baked_dir):
+        if filename not in keep:
+            os.remove(os.path.join(baked_dir, filename))
+
+    with open(index_path, "w") as f:
+        json.dump(index, f, indent=2)
+    _index = index
+    return index
+
+if __name__ == "__main__":
+    bake_assets()
@@ -0,0 +1,129 @@
+"""
+Progressive boot: game modules, images and sounds load on a worker thread while
+the mode selection screen is already up
+
+Starting a round waits for the game images and the gameplay sounds; the rest of
+the sound bank keeps building during play.
+"""
+import os
+import threading
+from constants import assets_dir, MODE_IMAGES
+from profiling import profiler
+
+# Sounds a round can't start without; music and screen sounds may finish later
+GAMEPLAY_SOUNDS = ["shoot", "explosion", "explosion_2", "shield_bounce", "player_death"]
+
+class BootLoader:
+    def __init__(self):
+        # Mode cards come first since the selection screen shows them; importing the
+        # game starts the sound bank building before the sprites are decoded
+        self.tasks = [("mode cards", self._load_mode_cards),
+                      ("game modules", self._import_game),
+                      ("sprites", self._load_sprites)]
+        self.tasks += [(f"sheera {mode}", lambda mode=mode: self._load_mode_image(mode))
+                       for mode in MODE_IMAGES]
+        self.tasks.append(("asteroid rotations", self._prewarm_rotations))
+        # Tasks that pack images into the sprite atlas. The game blits straight from
+        # atlas pages, so none of these may still be writing to them once play starts
+        self.atlas_tasks = [name for name, _ in self.tasks[2:]]
+        self.done = set()
+        self.current = None
+        self.mode_cards = {}
+        self.sounds = None
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def start(self):
+        """Start loading in the background; safe to call more than once"""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="boot", daemon=True)
+                self.thread.start()
+
+    def _run(self):
+        for name, task in self.tasks:
+            self.current = name
+            try:
+                with profiler.phase(name):
+                    task()
+            except Exception as e:
+                # The game falls back to loading (or placeholders) on demand
+                print(f"Boot task '{name}' failed: {e}")
+            with self.lock:
+                self.done.add(name)
+        self.current = None
+
+    def _load_mode_cards(self):
+        from registry import registry
+        for mode, filename in MODE_IMAGES.items():
+            try:
+                self.mode_cards[mode] = registry.get(os.path.join(assets_dir, filename), (300, 300),
+                                                    category="screens")
+            except Exception:
+                self.mode_cards[mode] = None
+
+    def _import_game(self):
+        from game import sounds
+        self.sounds = sounds
+        sounds.prewarm()
+
+    def _load_sprites(self):
+        import sprites
+        import effects
+        sprites.get_sprite_assets()
+        for size in (1, 2, 3):
+            sprites.get_asteroid_image(size)
+            effects.get_explosion_frames(size)
+        for frames in sprites.get_soundwave_frames().values():
+            frames.prewarm()
+        # Enough asteroids for a few full splits without building new sprites
+        sprites.asteroid_pool.prefill(24)
+
+    def _prewarm_rotations(self):
+        import sprites
+        for size in (1, 2, 3):
+            sprites.get_asteroid_rotations(size).prewarm()
+
+    def _load_mode_image(self, mode):
+        import sprites
+        sprites.get_mode_image(mode)
+
+    def requirements(self, mode):
+        """Tasks and sounds a round in the given mode needs before it can start.
+
+        Every atlas task is included whatever the mode, including the other mode's
+        image and the asteroid rotations.
+        """
+        return ["game modules"] + self.atlas_tasks + GAMEPLAY_SOUNDS
+
+    def ready(self, names):
+        with self.lock:
+            for name in names:
+                if any(name == task for task, _ in self.tasks):
+                    if name not in self.done:
+                        return False
+                elif self.sounds is None or not self.sounds.is_ready(name):
+                    return False
+            return True
+
+    def progress(self):
+        """(fraction complete, label) across the boot tasks and the sound bank"""
+        with self.lock:
+            task_fraction = len(self.done) / len(self.tasks)
+            if self.sounds is None:
+                sound_fraction = 0.0
+            else:
+                built = sum(1 for name in self.sounds.specs if self.sounds.is_ready(name))
+                sound_fraction = built / len(self.sounds.specs)
+        label = self.current or ("sounds" if sound_fraction < 1 else "done")
+        return (task_fraction + sound_fraction) / 2, label
+
+    def wait(self):
+        """Block until every task is done and the whole sound bank is built"""
+        self.start()
+        self.thread.join()
+        if self.sounds is not None:
+            self.sounds.wait()
+
+    def finished(self):
+        return self.progress()[0] >= 1
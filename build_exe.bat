@@ -2,6 +2,9 @@
 echo Installing cx_Freeze if not already installed...
 pip install cx_Freeze
 
+echo Packing game assets...
+python assetpack.py
+
 echo Building executable...
 python setup.py build
 
@@ -4,10 +4,6 @@ Game constants and configuration
 import pygame
 import os
 
-# Initialize pygame
-pygame.init()
-pygame.mixer.init()
-
 # Game constants
 WIDTH, HEIGHT = 1024, 768
 FPS = 60
@@ -17,10 +13,36 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
 
-# Create the game window
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Sheera vs Iguanas")
+# The window is created lazily by display.py; see __getattr__ below
 clock = pygame.time.Clock()
 
 # Assets directory
-assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
\ No newline at end of file
+assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+# Artwork for each selectable game mode (player sprite and mode selection card)
+MODE_IMAGES = {
+    "accelerated": "ChatGPT Image Jun 12, 2025, 07_17_20 PM.png",
+    "slowed": "Generated Image June 12, 2025 - 7_16PM.png",
+}
+
+# Degrees between the precomputed rotation frames of iguana asteroids
+ASTEROID_ROTATION_STEP = 3
+# Degrees between Sheera's rotation frames, and whether they're filtered with rotozoom
+SHEERA_ROTATION_STEP = 2
+SHEERA_SMOOTH_ROTATION = False
+# Degrees between the baked firing angles of sound wave projectiles
+SOUNDWAVE_ROTATION_STEP = 3
+# Shield and heat glow frames are cached per strength/heat level (this many across
+# the range) and per phase of the shield's pulse
+EFFECT_LEVELS = 10
+SHIELD_PULSE_PHASES = 8
+
+# Generated caches (synthesized sounds, baked images); safe to delete
+cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+def __getattr__(name):
+    # Keep `from constants import screen` working without opening a window at import
+    if name == "screen":
+        from display import get_screen
+        return get_screen()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,92 @@
+"""
+Display and mixer setup, deferred until something actually draws or plays
+
+Importing game modules no longer opens a window or an audio device. The first
+call to get_screen() (or an explicit init()) does. Set SHEERAROIDS_HEADLESS=1, or
+pass headless=True, to run on SDL's dummy video and audio drivers with an
+offscreen screen surface; tools, tests and benchmarks can use session().
+"""
+import os
+import threading
+from contextlib import contextmanager
+import pygame
+from constants import WIDTH, HEIGHT
+from profiling import profiler
+
+_screen = None
+_headless = False
+_lock = threading.RLock()
+
+def headless_requested():
+    """True if headless mode was asked for through the environment"""
+    return os.environ.get("SHEERAROIDS_HEADLESS", "0") not in ("", "0")
+
+def _use_dummy_drivers():
+    # Must be set before the video and audio subsystems are initialized
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+def init_mixer():
+    """Initialize just the audio mixer, which is all sound synthesis needs"""
+    with _lock:
+        if pygame.mixer.get_init():
+            return True
+        if headless_requested() or _headless:
+            _use_dummy_drivers()
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Audio unavailable: {e}")
+            return False
+        return True
+
+def init(headless=None):
+    """Initialize pygame, the mixer and the game window; returns the screen surface.
+
+    In headless mode the screen is an offscreen surface of the normal game size.
+    Calling init() again returns the existing screen.
+    """
+    global _screen, _headless
+    with _lock:
+        if _screen is not None:
+            return _screen
+        if headless is None:
+            headless = headless_requested()
+        _headless = headless
+        if headless:
+            _use_dummy_drivers()
+
+        with profiler.phase("display init"):
+            pygame.init()
+            init_mixer()
+            if headless:
+                # A (tiny) video mode is still needed for convert() and convert_alpha()
+                pygame.display.set_mode((1, 1))
+                _screen = pygame.Surface((WIDTH, HEIGHT)).convert()
+            else:
+                _screen = pygame.display.set_mode((WIDTH, HEIGHT))
+                pygame.display.set_caption("Sheera vs Iguanas")
+        return _screen
+
+def get_screen():
+    """Return the screen surface, initializing the display on first use"""
+    return _screen if _screen is not None else init()
+
+def is_headless():
+    return _headless
+
+def shutdown():
+    """Tear down pygame so that a later init() starts fresh"""
+    global _screen
+    with _lock:
+        _screen = None
+        pygame.quit()
+
+@contextmanager
+def session(headless=None):
+    """Context manager that initializes the display and shuts it down afterwards"""
+    screen = init(headless)
+    try:
+        yield screen
+    finally:
+        shutdown()
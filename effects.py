@@ -4,10 +4,17 @@ Visual effects: Explosions, Fragments, Particles
 import pygame
 import math
 import random
+import threading
+import numpy as np
 from constants import WIDTH, HEIGHT
+from registry import registry
+from particles import radial_angles
 
 class FinalDeathExplosion(pygame.sprite.Sprite):
-    """Simple but cool two-burst particle explosion for final death"""
+    """Simple but cool two-burst particle explosion for final death
+
+    Sounds are given as names in the game's sound bank and looked up when played.
+    """
     def __init__(self, center, game, sound1=None, sound2=None, particle_sound=None):
         pygame.sprite.Sprite.__init__(self)
         self.center = center
@@ -29,20 +36,20 @@ class FinalDeathExplosion(pygame.sprite.Sprite):
         if self.frame == 1 and not self.burst_triggered[0]:
             self.create_particle_burst(self.center, 100, 8, [(255, 255, 0), (255, 200, 0), (255, 150, 0)])
             if self.sound1:
-                self.sound1.play()
+                self.game.sounds.play(self.sound1)
             self.burst_triggered[0] = True
         
         # Second burst - delayed for impact with different sound
         if self.frame == 20 and not self.burst_triggered[1]:
             self.create_particle_burst(self.center, 150, 12, [(255, 0, 0), (255, 100, 0), (255, 255, 255)])
             if self.sound2:
-                self.sound2.play()
+                self.game.sounds.play(self.sound2)
             self.burst_triggered[1] = True
         
         # Particle shrinking sound - slightly after second burst
         if self.frame == 30 and not self.burst_triggered[2]:
             if self.particle_sound:
-                self.particle_sound.play()
+                self.game.sounds.play(self.particle_sound)
             self.burst_triggered[2] = True
         
         # Kill after all effects are done
@@ -51,25 +58,11 @@ class FinalDeathExplosion(pygame.sprite.Sprite):
     
     def create_particle_burst(self, center, count, max_speed, colors):
         """Create a burst of particles"""
-        from sprites import FireworkParticle
-        
-        for i in range(count):
-            angle = (i / count) * 2 * math.pi + random.uniform(-0.2, 0.2)
-            speed = random.uniform(max_speed * 0.8, max_speed * 1.5)  # Faster particles
-            velocity = pygame.math.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            color = random.choice(colors)
-            
-            particle = FireworkParticle(center, velocity, color)
-            particle.lifetime = random.randint(120, 180)  # Much longer lifetime for shrinking effect
-            # Recreate image with new size
-            new_size = random.randint(4, 8)
-            particle.size = new_size
-            particle.image = pygame.Surface((new_size * 2, new_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle.image, color, (new_size, new_size), new_size)
-            particle.rect = particle.image.get_rect(center=center)
-            
-            self.game.all_sprites.add(particle)
-            self.game.particles.add(particle)
+        angles = radial_angles(count, jitter=0.2)
+        speeds = np.random.uniform(max_speed * 0.8, max_speed * 1.5, count)  # Faster particles
+        # Much longer lifetime and bigger dots for the shrinking effect
+        self.game.particles.burst(center, angles, speeds, colors, lifetime=(120, 180),
+                                  size=np.random.randint(4, 9, count), shrink=True)
 
 class ImageFragment(pygame.sprite.Sprite):
     def __init__(self, surface, position, velocity, rotation_speed, game):
@@ -179,7 +172,8 @@ class PlayerExplosion(pygame.sprite.Sprite):
         for row in range(rows):
             for col in range(cols):
                 # Create fragment surface
-                frag_surface = pygame.Surface((frag_width, frag_height), pygame.SRCALPHA)
+                frag_surface = registry.track(
+                    pygame.Surface((frag_width, frag_height), pygame.SRCALPHA), "effects")
                 
                 # Copy portion of original image
                 src_rect = pygame.Rect(col * frag_width, row * frag_height, 
@@ -252,74 +246,117 @@ class PlayerExplosion(pygame.sprite.Sprite):
                                 self.position[1] - self.shockwave_radius - 5),
                                special_flags=pygame.BLEND_ADD)
 
+def draw_digital_rain(surface, glyphs, progress, column_spacing=20, row_spacing=15):
+    """Matrix-style rain of random glyphs, reaching further down the screen as progress grows.
+
+    glyphs is a GlyphStrip of the characters to rain; rows fade out with depth,
+    each row blitted from a pre-faded copy of the strip.
+    """
+    rain_height = min(int((progress - 0.4) * HEIGHT * 2), HEIGHT)
+    # Rows fade by 3 alpha per pixel down; the ones past full transparency are skipped
+    rows = [y for y in range(0, max(0, rain_height), row_spacing) if 255 - y * 3 > 0]
+    if not rows:
+        return
+    columns = np.arange(0, WIDTH, column_spacing)
+    chars = list(glyphs.areas)
+    picks = np.random.randint(0, len(chars), (len(rows), len(columns))).tolist()
+    jitter = (columns + np.random.randint(-5, 6, (len(rows), len(columns)))).tolist()
+    blits = []
+    for y, row_picks, row_x in zip(rows, picks, jitter):
+        strip = glyphs.faded(255 - y * 3)
+        blits.extend((strip, (x, y), glyphs.areas[chars[pick]]) for pick, x in zip(row_picks, row_x))
+    surface.blits(blits, doreturn=False)
+
+# Ring colors, cycled one step per frame
+EXPLOSION_COLORS = [
+    (255, 0, 0), (255, 165, 0), (255, 255, 0),
+    (0, 255, 0), (0, 0, 255), (128, 0, 128), (255, 255, 255)
+]
+
+_explosion_frames = {}
+_explosion_lock = threading.Lock()
+
+def _crop_to_content(canvas, center):
+    """Copy of the smallest square of canvas around center holding every visible pixel"""
+    bounds = canvas.get_bounding_rect()
+    if not bounds:
+        return pygame.Surface((0, 0), pygame.SRCALPHA)
+    extent = max(center - bounds.left, bounds.right - center,
+                 center - bounds.top, bounds.bottom - center)
+    image = canvas.subsurface(
+        pygame.Rect(center - extent, center - extent, extent * 2, extent * 2)).copy()
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+    # Rings are mostly transparent, which run-length encoding skips over when blitting
+    image.set_alpha(255, pygame.RLEACCEL)
+    return registry.track(image, "effects")
+
+def get_explosion_frames(size):
+    """Every image an explosion of the given size shows, baked on first use.
+
+    frames[n] is the image after n updates (frame 0 is blank); an explosion is
+    done once it runs out of frames. Frames are cropped to their rings.
+    """
+    with _explosion_lock:
+        if size in _explosion_frames:
+            return _explosion_frames[size]
+
+        max_radius = size * 60
+        canvas = pygame.Surface((max_radius * 2, max_radius * 2), pygame.SRCALPHA)
+        frames = [pygame.Surface((0, 0), pygame.SRCALPHA)]
+        scratch = pygame.Surface((1, 1))
+        radius, alpha, frame = size * 20, 255, 0
+        while True:
+            if radius < max_radius:
+                radius += size * 3
+            alpha = max(0, alpha - 8)
+            if radius >= max_radius and alpha <= 0:
+                break
+            canvas.fill((0, 0, 0, 0))
+            # Draw multiple colored rings for dramatic effect
+            for i in range(3):
+                ring_radius = radius - i * 10
+                if ring_radius > 0:
+                    color = EXPLOSION_COLORS[(frame + i) % len(EXPLOSION_COLORS)]
+                    pygame.draw.circle(canvas, (*color, alpha // (i + 1)),
+                                       (max_radius, max_radius), int(ring_radius), max(2, 5 - i))
+            # Draw bright center flash
+            if radius < max_radius // 2:
+                pygame.draw.circle(canvas, (255, 255, 255, min(255, alpha * 2)),
+                                   (max_radius, max_radius), int(radius * 1.5))
+            frames.append(_crop_to_content(canvas, max_radius))
+            # SDL encodes on the first blit (dropping the raw pixels); do it now, not in play
+            scratch.blit(frames[-1], (0, 0))
+            frame += 1
+
+        _explosion_frames[size] = frames
+        return frames
+
 class Explosion(pygame.sprite.Sprite):
     def __init__(self, center, size):
         pygame.sprite.Sprite.__init__(self)
         self.center = center
         self.size = size
-        self.particles = []
         self.frame = 0
-        self.last_update = pygame.time.get_ticks()
-        self.frame_duration = 20  # milliseconds
-        self.colors = [
-            (255, 0, 0), (255, 165, 0), (255, 255, 0),
-            (0, 255, 0), (0, 0, 255), (128, 0, 128), (255, 255, 255)
-        ]
-        # Create visible explosion sprite
-        self.radius = size * 20
-        self.max_radius = size * 60
-        self.image = pygame.Surface((self.max_radius * 2, self.max_radius * 2), pygame.SRCALPHA)
+        self.colors = EXPLOSION_COLORS
+        # Shared, pre-rendered ring animation
+        self.frames = get_explosion_frames(size)
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(center=center)
-        self.alpha = 255
         
     def create_particles(self, game):
-        from sprites import FireworkParticle
-        # Create firework particles
+        # Create firework particles in random directions
         num_particles = self.size * 15
-        for _ in range(num_particles):
-            # Random direction
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 5 + self.size)  # Increased speed
-            velocity = pygame.math.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            color = random.choice(self.colors)
-            particle = FireworkParticle(self.center, velocity, color)
-            game.all_sprites.add(particle)
-            game.particles.add(particle)  # Add to particles group too!
-            self.particles.append(particle)
+        angles = np.random.uniform(0, 2 * math.pi, num_particles)
+        speeds = np.random.uniform(2, 5 + self.size, num_particles)  # Increased speed
+        game.particles.burst(self.center, angles, speeds, self.colors)
         
     def update(self):
-        # Expand explosion radius
-        if self.radius < self.max_radius:
-            self.radius += self.size * 3
-        
-        # Fade out
-        self.alpha = max(0, self.alpha - 8)
-        
-        # Clear image
-        self.image.fill((0, 0, 0, 0))
-        
-        # Draw explosion circles
-        if self.alpha > 0:
-            # Draw multiple colored rings for dramatic effect
-            for i in range(3):
-                ring_radius = self.radius - i * 10
-                if ring_radius > 0:
-                    color_idx = (self.frame + i) % len(self.colors)
-                    color = self.colors[color_idx]
-                    ring_alpha = self.alpha // (i + 1)
-                    pygame.draw.circle(self.image, (*color, ring_alpha),
-                                     (self.max_radius, self.max_radius),
-                                     int(ring_radius), max(2, 5 - i))
-            
-            # Draw bright center flash
-            if self.radius < self.max_radius // 2:
-                flash_radius = int(self.radius * 1.5)
-                pygame.draw.circle(self.image, (255, 255, 255, min(255, self.alpha * 2)),
-                                 (self.max_radius, self.max_radius),
-                                 flash_radius)
-        
         self.frame += 1
         
         # Kill after fully expanded and faded
-        if self.radius >= self.max_radius and self.alpha <= 0:
-            self.kill()
\ No newline at end of file
+        if self.frame >= len(self.frames):
+            self.kill()
+            return
+        self.image = self.frames[self.frame]
+        self.rect = self.image.get_rect(center=self.center)
@@ -0,0 +1,150 @@
+"""
+Fonts and text rendering caches: a process-wide font pool, rendered strings and
+digit strips
+
+Every screen gets its fonts from the pool, so each (face, size) is opened and
+parsed once. Text that is drawn every frame but rarely changes (the HUD) is
+rendered once per distinct string and reused; numbers that change often (the
+score) are composed from a strip of pre-rendered digits instead of going through
+the font at all.
+"""
+import pygame
+import threading
+from collections import OrderedDict
+
+# Distinct strings kept rendered; least recently drawn are dropped past this
+TEXT_CACHE_SIZE = 256
+
+class FontPool:
+    """Fonts keyed by (face, size), opened on first request and shared after that.
+
+    face is a font file path, or None for pygame's default font. requests counts
+    every get() and created the fonts actually opened; the difference is the
+    number of font instantiations the pool saved.
+    """
+    def __init__(self):
+        self.fonts = {}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.created = 0
+
+    def get(self, size, face=None):
+        with self.lock:
+            self.requests += 1
+            font = self.fonts.get((face, size))
+            if font is None:
+                font = self.fonts[(face, size)] = pygame.font.Font(face, size)
+                self.created += 1
+            return font
+
+    @property
+    def avoided(self):
+        return self.requests - self.created
+
+    def format_stats(self):
+        return (f"fonts: {self.created} opened for {self.requests} requests "
+                f"({self.avoided} instantiations avoided)")
+
+    def clear(self):
+        """Drop every font; needed if pygame.font is shut down and re-initialized"""
+        with self.lock:
+            self.fonts.clear()
+
+class TextCache:
+    """Rendered text surfaces keyed by (text, color, font size).
+
+    Surfaces are shared by every caller drawing the same text and must be treated
+    as read-only.
+    """
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, size, text, color):
+        """font.render(text, True, color), from the cache when possible"""
+        key = (text, tuple(color), size)
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+            from registry import registry
+            surface = registry.track(font.render(text, True, color), "fonts")
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+            return surface
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+
+DIGITS = "0123456789"
+# Every visible ASCII character (33-126)
+PRINTABLE_ASCII = "".join(chr(code) for code in range(33, 127))
+
+class GlyphStrip:
+    """Single characters of one font and color rendered once, side by side in one surface.
+
+    Text drawn from the strip is a few area blits and never touches the font;
+    the spacing is each glyph's own width, without kerning.
+    """
+    def __init__(self, font, color, chars):
+        from registry import registry
+        glyphs = [font.render(char, True, color) for char in chars]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        self.strip = registry.track(pygame.Surface(
+            (sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA), "fonts")
+        self.areas = {}
+        x = 0
+        for char, glyph in zip(chars, glyphs):
+            self.strip.blit(glyph, (x, 0))
+            self.areas[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+        self.fades = {255: self.strip}  # alpha -> strip with that alpha baked in
+
+    def faded(self, alpha):
+        """The strip with every pixel's alpha scaled by alpha/255, made on first use.
+
+        Blitting areas of a pre-faded strip is much cheaper than blitting with a
+        surface alpha on top of per-pixel alpha.
+        """
+        strip = self.fades.get(alpha)
+        if strip is None:
+            from registry import registry
+            strip = registry.track(self.strip.copy(), "fonts")
+            strip.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self.fades[alpha] = strip
+        return strip
+
+    def width(self, text):
+        return sum(self.areas[char].width for char in str(text))
+
+    def draw(self, surface, text, position):
+        """Blit text (anything str() turns into strip characters) at position; returns the covered rect"""
+        x, y = position
+        blits = []
+        for char in str(text):
+            area = self.areas[char]
+            blits.append((self.strip, (x, y), area))
+            x += area.width
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(position[0], y, x - position[0], self.height)
+
+class DigitStrip(GlyphStrip):
+    """The digits 0-9, for drawing numbers"""
+    def __init__(self, font, color):
+        super().__init__(font, color, DIGITS)
+
+# Shared by everything that draws text
+font_pool = FontPool()
+text_cache = TextCache()
+
+def get_font(size, face=None):
+    """The shared font of a face (None for the default font) and size"""
+    return font_pool.get(size, face)
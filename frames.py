@@ -0,0 +1,98 @@
+"""
+Precomputed sprite frames: rotations quantized to a fixed angle step, and effect
+frames keyed by quantized parameters
+
+Frames are rendered once and shared by every sprite showing the same image, so
+per-frame sprite updates become an index lookup.
+"""
+import pygame
+import threading
+from collections import OrderedDict
+from atlas import sprite_atlas
+from registry import registry
+
+class RotationCache:
+    """Rotated copies of one image at every multiple of a fixed angle step.
+
+    Frames are rendered on first use, or all at once with prewarm().
+    """
+    def __init__(self, key, image, step, smooth=False):
+        self.key = key
+        self.image = image
+        self.count = max(1, round(360 / step))
+        self.step = 360 / self.count  # exact divisor of 360
+        self.smooth = smooth  # rotozoom filters edges, rotate keeps hard pixels
+        self.frames = [None] * self.count
+
+    def index(self, angle):
+        """Frame index of the nearest cached angle"""
+        return int(round(angle / self.step)) % self.count
+
+    def frame(self, index):
+        frame = self.frames[index]
+        if frame is None:
+            # The image is usually an atlas subsurface, and rotating it locks its page
+            with sprite_atlas.lock:
+                angle = index * self.step
+                if self.smooth:
+                    rotated = pygame.transform.rotozoom(self.image, angle, 1)
+                else:
+                    rotated = pygame.transform.rotate(self.image, angle)
+                frame = self.frames[index] = sprite_atlas.add((self.key, self.step, index), rotated)
+        return frame
+
+    def get(self, angle):
+        return self.frame(self.index(angle))
+
+    def prewarm(self):
+        for index in range(self.count):
+            self.frame(index)
+
+_caches = {}
+_lock = threading.Lock()
+
+def rotation_cache(key, image, step, smooth=False):
+    """The shared RotationCache for an image key, created on first request"""
+    with _lock:
+        cache = _caches.get((key, step, smooth))
+        if cache is None:
+            cache = _caches[(key, step, smooth)] = RotationCache(key, image, step, smooth)
+        return cache
+
+class FrameCache:
+    """Effect frames rendered on first use from a tuple of quantized parameters.
+
+    Frames are shared by every caller (and every game) asking for the same key;
+    past the byte budget the least recently used ones are dropped. With rle the
+    frames are run-length encoded, which makes blitting mostly transparent frames
+    much cheaper but their first blit (when SDL encodes them) dearer.
+    """
+    def __init__(self, render, budget, category="effects", rle=False):
+        self.render = render
+        self.budget = budget
+        self.category = category
+        self.rle = rle
+        self.frames = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, *key):
+        with self.lock:
+            frame = self.frames.get(key)
+            if frame is not None:
+                self.frames.move_to_end(key)
+                return frame
+            frame = registry.track(self.render(*key), self.category)
+            if self.rle:
+                frame.set_alpha(255, pygame.RLEACCEL)
+            self.frames[key] = frame
+            self.bytes += frame.get_pitch() * frame.get_height()
+            while self.bytes > self.budget and len(self.frames) > 1:
+                _, dropped = self.frames.popitem(last=False)
+                self.bytes -= dropped.get_pitch() * dropped.get_height()
+            return frame
+
+    def clear(self):
+        with self.lock:
+            self.frames.clear()
+            self.bytes = 0
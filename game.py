@@ -4,21 +4,63 @@ Main game class and logic
 import pygame
 import math
 import random
-from constants import WIDTH, HEIGHT, WHITE, BLACK, screen, clock
-from sprites import Sheera, Asteroid, SoundWave, FireworkParticle
-from effects import Explosion, FinalDeathExplosion
+from constants import WIDTH, HEIGHT, WHITE, BLACK
+from display import get_screen
+from sprites import Sheera, SoundWave, asteroid_pool
+from effects import Explosion, FinalDeathExplosion, draw_digital_rain
 from highscores import HighScoreManager
 from screens import PurpleInitialsScreen, CleanHighScoresScreen
-from audio import load_all_sounds
+from soundbank import SoundBank
+from renderer import DirtyRenderer
+from particles import ParticleSystem
+from fonts import text_cache, DigitStrip, GlyphStrip, PRINTABLE_ASCII, get_font
+from registry import registry
 
-# Load all sounds at module level
-(shoot_sound, explosion_sound, explosion_sound_2, death_sound_80s, transition_music_80s, 
- final_death_sound_80s, game_over_music, typing_sound, high_scores_music,
- transition_sweep, victory_fanfare, wrong_answer_sound, particle_shrinking_sound,
- player_death_sound, shield_bounce_sound) = load_all_sounds()
+# Sounds are synthesized on first use and prewarmed in the background
+sounds = SoundBank()
 
 class Game:
-    def __init__(self, game_mode="normal"):
+    def __init__(self, game_mode="normal", dirty_rects=False):
+        # Everything set up here survives warm restarts (see reset)
+        # Optional renderer that redraws only changed regions during play
+        self.renderer = DirtyRenderer() if dirty_rects else None
+        
+        # Start building sounds in priority order without blocking the first frame
+        self.sounds = sounds
+        self.sounds.prewarm()
+        
+        # High score system
+        self.high_score_manager = HighScoreManager()
+        
+        # Create sprite groups
+        self.all_sprites = pygame.sprite.Group()
+        self.asteroids = pygame.sprite.Group()
+        self.bullets = pygame.sprite.Group()
+        self.explosions = pygame.sprite.Group()
+        self.particles = ParticleSystem()  # drawn and updated apart from all_sprites
+        self.trails = pygame.sprite.Group()  # New group for motion trails
+        
+        # Create player (Sheera) with the selected game mode
+        self.player = Sheera(game_mode)
+        
+        # Load font
+        self.font = get_font(36)
+        # The score is drawn from pre-rendered digits, other HUD text through the text cache
+        self.digits = DigitStrip(self.font, WHITE)
+        self.number_surfaces = {}  # label -> (number, composed surface)
+        # Neon green glyphs for the digital rain of the restart transition
+        self.rain_glyphs = GlyphStrip(get_font(24), (0, 255, 100), PRINTABLE_ASCII)
+        
+        self.reset(game_mode)
+    
+    def reset(self, game_mode=None):
+        """Start a new round in place (warm restart).
+
+        Simulation state goes back to the start; sounds, score data, the font,
+        sprite groups and the player object are kept. Passing a mode switches to it.
+        """
+        if game_mode is None:
+            game_mode = self.game_mode
         self.score = 0
         self.level = 1
         self.game_over = False
@@ -27,8 +69,6 @@ class Game:
         self.explosion_created = False
         self.game_mode = game_mode
         
-        # High score system
-        self.high_score_manager = HighScoreManager()
         self.game_state = "playing"  # "playing", "death_pause", "entering_initials", "showing_high_scores"
         self.purple_initials_screen = None
         self.high_scores_screen = None
@@ -50,16 +90,15 @@ class Game:
             self.speed_multiplier = 1.0
             self.rotation_multiplier = 1.0
         
-        # Create sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.asteroids = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.explosions = pygame.sprite.Group()
-        self.particles = pygame.sprite.Group()
-        self.trails = pygame.sprite.Group()  # New group for motion trails
+        # Clear out the last round's sprites, keeping the asteroids for reuse
+        for asteroid in list(self.asteroids):
+            asteroid_pool.release(asteroid)
+        for group in (self.all_sprites, self.asteroids, self.bullets,
+                      self.explosions, self.particles, self.trails):
+            group.empty()
         
-        # Create player (Sheera) with the selected game mode
-        self.player = Sheera(game_mode)
+        # Reset the player for the selected game mode
+        self.player.reset(game_mode)
         # Apply game mode modifiers to player
         self.player.rotation_speed *= self.rotation_multiplier
         self.player.acceleration *= self.speed_multiplier
@@ -69,12 +108,13 @@ class Game:
         # Spawn initial asteroids
         self.spawn_asteroids(self.level + 2)
         
-        # Load font
-        self.font = pygame.font.Font(None, 36)
+        # The mode selection screen has drawn over everything
+        if self.renderer:
+            self.renderer.invalidate()
     
     def spawn_asteroids(self, count):
         for _ in range(count):
-            asteroid = Asteroid(3)  # Start with large asteroids
+            asteroid = asteroid_pool.acquire(3)  # Start with large asteroids
             # Apply speed multiplier to asteroid
             asteroid.velocity *= self.speed_multiplier
             asteroid.rotation_speed *= self.rotation_multiplier
@@ -111,8 +151,7 @@ class Game:
                             bullet.velocity *= self.speed_multiplier
                             self.bullets.add(bullet)
                             self.all_sprites.add(bullet)
-                            if shoot_sound:
-                                shoot_sound.play()
+                            self.sounds.play("shoot")
                     if event.key == pygame.K_p and not self.controls_disabled:
                         self.paused = not self.paused
                 
@@ -127,9 +166,7 @@ class Game:
                             # After entering initials, show high scores
                             self.game_state = "showing_high_scores"
                             self.high_scores_screen = CleanHighScoresScreen(self.score, self.high_score_manager.get_high_scores())
-                            # Play high scores music
-                            if high_scores_music:
-                                high_scores_music.play(-1)
+                            # The high scores music starts from update() once it is built
                 
                 elif self.game_state == "showing_high_scores":
                     # Only allow ENTER to restart after 10 seconds
@@ -161,6 +198,10 @@ class Game:
         
         # Handle paused or non-playing states
         if self.paused or self.game_state != "playing":
+            # Start the high scores music on the first frame it is ready
+            if self.game_state == "showing_high_scores" and not self.music_started:
+                self.music_started = self.sounds.play("high_scores_music", -1) is not None
+            
             # Handle death pause
             if self.game_state == "death_pause":
                 self.death_pause_timer += 1
@@ -171,17 +212,20 @@ class Game:
                         self.all_sprites.remove(self.player)
                 
                 # UPDATE EXPLOSIONS AND PARTICLES DURING DEATH PAUSE!
+                # Both run at double speed here, the final death burst is tuned for it
                 self.explosions.update()
-                self.particles.update()
+                self.particles.update(steps=2)
                 # Also update any other explosion-related sprites
                 for sprite in self.all_sprites:
-                    if isinstance(sprite, (Explosion, FireworkParticle)):
+                    if isinstance(sprite, Explosion):
                         sprite.update()
                 
                 if self.death_pause_timer >= self.death_pause_duration:
-                    # Always go to purple initials screen after death
+                    # Always go to purple initials screen after death; it looks the typing
+                    # sound up on each key press, so one still being built isn't lost
                     self.game_state = "entering_initials"
-                    self.purple_initials_screen = PurpleInitialsScreen(self.score, typing_sound)
+                    self.purple_initials_screen = PurpleInitialsScreen(
+                        self.score, lambda: self.sounds.get("typing"))
             return
             
         # Check for spacebar held down (rapid fire) - only if controls aren't disabled
@@ -193,15 +237,15 @@ class Game:
                     bullet.velocity *= self.speed_multiplier
                     self.bullets.add(bullet)
                     self.all_sprites.add(bullet)
-                    if shoot_sound:
-                        shoot_sound.play()
+                    self.sounds.play("shoot")
             
         # Update all sprites
         self.all_sprites.update()
+        self.particles.update()
         
         # Check for shield-bullet collisions (reflect bullets)
         if self.player.shield_active:
-            shield_radius = int(self.player.rect.width * (1.5 + self.player.shield_strength / self.player.max_shield))
+            shield_radius = self.player.shield_radius()
             for bullet in self.bullets:
                 # Calculate distance between bullet and player center
                 distance = pygame.math.Vector2(bullet.rect.center).distance_to(self.player.position)
@@ -225,23 +269,23 @@ class Game:
             self.all_sprites.add(explosion)
             explosion.create_particles(self)
             # Play explosion sound
-            if explosion_sound:
-                explosion_sound.play()
+            self.sounds.play("explosion")
             
             # Split asteroid
             new_asteroids = asteroid.split()
             for new_asteroid in new_asteroids:
                 new_asteroid.rect.center = asteroid.rect.center
-                new_asteroid.position = pygame.math.Vector2(asteroid.rect.center)
+                new_asteroid.position.update(asteroid.rect.center)
                 # Apply speed multiplier to split asteroids
                 new_asteroid.velocity *= self.speed_multiplier
                 new_asteroid.rotation_speed *= self.rotation_multiplier
                 self.asteroids.add(new_asteroid)
                 self.all_sprites.add(new_asteroid)
+            asteroid_pool.release(asteroid)
         
         # Check for shield-asteroid collisions
         if self.player.shield_active and not self.player.hidden:
-            shield_radius = int(self.player.rect.width * (1.5 + self.player.shield_strength / self.player.max_shield))
+            shield_radius = self.player.shield_radius()
             shield_hits = []
             
             # Check each asteroid for collision with shield
@@ -263,26 +307,24 @@ class Game:
                 self.create_reflection_effect(asteroid.rect.center)
                 
                 # Play shield bounce sound
-                if shield_bounce_sound:
-                    shield_bounce_sound.play()
+                self.sounds.play("shield_bounce")
                 
                 # Only split if asteroid is larger than size 1
                 if asteroid.size > 1:
                     new_size = asteroid.size - 1
                     for _ in range(3):  # Create 3 smaller asteroids
-                        new_asteroid = Asteroid(new_size)
+                        new_asteroid = asteroid_pool.acquire(new_size)
                         new_asteroid.rect.center = asteroid.rect.center
-                        new_asteroid.position = pygame.math.Vector2(asteroid.rect.center)
+                        new_asteroid.position.update(asteroid.rect.center)
                         
                         # Bounce away from shield with random angle
                         angle = random.uniform(0, 2 * math.pi)
                         speed = random.uniform(2, 4) * self.speed_multiplier
-                        new_asteroid.velocity = pygame.math.Vector2(
-                            math.cos(angle) * speed, math.sin(angle) * speed
-                        )
+                        new_asteroid.velocity.update(math.cos(angle) * speed, math.sin(angle) * speed)
                         
                         self.asteroids.add(new_asteroid)
                         self.all_sprites.add(new_asteroid)
+                asteroid_pool.release(asteroid)
                 
                 # Reduce shield strength when hit
                 self.player.shield_strength = max(0, self.player.shield_strength - 10)
@@ -305,9 +347,9 @@ class Game:
                     final_explosion = FinalDeathExplosion(
                         player_center, 
                         self,
-                        sound1=explosion_sound,
-                        sound2=explosion_sound_2,
-                        particle_sound=particle_shrinking_sound
+                        sound1="explosion",
+                        sound2="explosion_2",
+                        particle_sound="particle_shrinking"
                     )
                     self.explosions.add(final_explosion)
                     self.all_sprites.add(final_explosion)
@@ -330,19 +372,19 @@ class Game:
                     self.all_sprites.add(explosion)
                     explosion.create_particles(self)
                     # Play player death sound (different from explosion)
-                    if player_death_sound:
-                        player_death_sound.play()
+                    self.sounds.play("player_death")
                 
                 # Split asteroid
                 new_asteroids = asteroid.split()
                 for new_asteroid in new_asteroids:
                     new_asteroid.rect.center = asteroid.rect.center
-                    new_asteroid.position = pygame.math.Vector2(asteroid.rect.center)
+                    new_asteroid.position.update(asteroid.rect.center)
                     # Apply speed multiplier to split asteroids
                     new_asteroid.velocity *= self.speed_multiplier
                     new_asteroid.rotation_speed *= self.rotation_multiplier
                     self.asteroids.add(new_asteroid)
                     self.all_sprites.add(new_asteroid)
+                asteroid_pool.release(asteroid)
                 
                 if self.player.lives <= 0:
                     # Game over
@@ -357,6 +399,7 @@ class Game:
             self.spawn_asteroids(self.level + 2)
     
     def draw(self):
+        screen = get_screen()
         # Handle different game states
         # print(f"DEBUG: Drawing game state: {self.game_state}")  # Commented to reduce spam
         if self.game_state == "death_pause":
@@ -368,10 +411,12 @@ class Game:
             
             # No special screen effects needed for simple explosion
             
-            self.draw_text(f"Score: {self.score}", 10, 10)
+            self.draw_number("Score: ", self.score, 10, 10)
             self.draw_text(f"Level: {self.level}", 10, 50)
             self.draw_text(f"Lives: {self.player.lives}", 10, 90)
             pygame.display.flip()
+            if self.renderer:
+                self.renderer.invalidate()
             return
         elif self.game_state == "entering_initials":
             if self.purple_initials_screen:
@@ -386,17 +431,22 @@ class Game:
         
         # Normal gameplay drawing
         # Draw background
-        screen.fill(BLACK)
+        if self.renderer:
+            self.renderer.begin(screen)  # erases only what the last frame drew
+        else:
+            screen.fill(BLACK)
         
         # Draw sprites in layers to handle glow effects
         # First draw trails
         for sprite in self.trails:
-            screen.blit(sprite.image, sprite.rect)
+            self.mark(screen.blit(sprite.image, sprite.rect))
             
         # Then draw other non-player sprites
         for sprite in self.all_sprites:
             if sprite != self.player and sprite not in self.trails:
-                screen.blit(sprite.image, sprite.rect)
+                self.mark(screen.blit(sprite.image, sprite.rect))
+        for rect in self.particles.draw(screen):
+            self.mark(rect)
         
         # Draw player with shield or glow (only if not exploding)
         if not self.player.hidden:
@@ -409,13 +459,13 @@ class Game:
             
             if should_draw:
                 if self.player.shield_active:
-                    self.player.draw_shield()
+                    self.mark(self.player.draw_shield())
                 elif self.player.heat > 0:
-                    self.player.draw_glow()
-                screen.blit(self.player.image, self.player.rect)
+                    self.mark(self.player.draw_glow())
+                self.mark(screen.blit(self.player.image, self.player.rect))
         
         # Draw HUD
-        self.draw_text(f"Score: {self.score}", 10, 10)
+        self.draw_number("Score: ", self.score, 10, 10)
         self.draw_text(f"Level: {self.level}", 10, 50)
         
         # Only show player-related HUD if player exists and isn't exploded
@@ -444,8 +494,8 @@ class Game:
                     shield_color = (200, 50, 255)  # Bright purple for critical shield
                 
                 # Draw text with shield color
-                shield_surface = self.font.render(shield_text, True, shield_color)
-                screen.blit(shield_surface, (WIDTH - 150, 90))
+                shield_surface = text_cache.render(self.font, 36, shield_text, shield_color)
+                self.mark(screen.blit(shield_surface, (WIDTH - 150, 90)))
                 
                 # Draw shield bar
                 bar_width = 100
@@ -456,11 +506,11 @@ class Game:
                 # Draw shield bar with pulsating effect for active shield
                 if self.player.shield_active:
                     pulse = math.sin(pygame.time.get_ticks() * 0.01) * 0.2 + 0.8
-                    pygame.draw.rect(screen, (shield_color[0]*pulse, shield_color[1]*pulse, shield_color[2]*pulse), fill_rect)
+                    self.mark(pygame.draw.rect(screen, (shield_color[0]*pulse, shield_color[1]*pulse, shield_color[2]*pulse), fill_rect))
                 else:
-                    pygame.draw.rect(screen, shield_color, fill_rect)
+                    self.mark(pygame.draw.rect(screen, shield_color, fill_rect))
                     
-                pygame.draw.rect(screen, WHITE, outline_rect, 1)
+                self.mark(pygame.draw.rect(screen, WHITE, outline_rect, 1))
         elif self.game_over:
             # Show lives as 0 when game over
             self.draw_text(f"Lives: 0", WIDTH - 100, 10)
@@ -468,13 +518,13 @@ class Game:
         # Show game mode
         mode_text = "ACCELERATED" if self.game_mode == "accelerated" else "SLOWED" if self.game_mode == "slowed" else "NORMAL"
         mode_color = (255, 200, 100) if self.game_mode == "accelerated" else (100, 200, 255) if self.game_mode == "slowed" else WHITE
-        mode_surface = self.font.render(f"Mode: {mode_text}", True, mode_color)
-        screen.blit(mode_surface, (WIDTH // 2 - 100, 10))
+        mode_surface = text_cache.render(self.font, 36, f"Mode: {mode_text}", mode_color)
+        self.mark(screen.blit(mode_surface, (WIDTH // 2 - 100, 10)))
         
         # Show shield controls hint
         if not self.game_over and not self.paused:
-            shield_hint = self.font.render("Press S for shield", True, (100, 150, 255))
-            screen.blit(shield_hint, (WIDTH // 2 - 100, HEIGHT - 30))
+            shield_hint = text_cache.render(self.font, 36, "Press S for shield", (100, 150, 255))
+            self.mark(screen.blit(shield_hint, (WIDTH // 2 - 100, HEIGHT - 30)))
         
         if self.game_over and self.game_state != "transition":
             self.draw_text("GAME OVER", WIDTH // 2 - 100, HEIGHT // 2 - 30)
@@ -489,10 +539,16 @@ class Game:
             alpha = min(255, int(progress * 255))
             
             # Create fade overlay
-            fade_surface = pygame.Surface((WIDTH, HEIGHT))
-            fade_surface.set_alpha(alpha)
-            fade_surface.fill((0, 0, 0))
-            screen.blit(fade_surface, (0, 0))
+            if self.renderer:
+                self.renderer.invalidate()
+            if alpha >= 255:
+                # Fully faded; SDL's surface-alpha blit is slowest of all at 255
+                screen.fill((0, 0, 0))
+            else:
+                fade_surface = pygame.Surface((WIDTH, HEIGHT))
+                fade_surface.set_alpha(alpha)
+                fade_surface.fill((0, 0, 0))
+                screen.blit(fade_surface, (0, 0))
             
             # Show restart instruction during transition
             self.draw_text("Press ENTER to restart", WIDTH // 2 - 120, HEIGHT - 50)
@@ -526,18 +582,7 @@ class Game:
                 
                 # Digital rain effect (Matrix-style but with 80s colors)
                 if progress > 0.4:
-                    for x in range(0, WIDTH, 20):
-                        rain_height = int((progress - 0.4) * HEIGHT * 2)
-                        for y in range(0, min(rain_height, HEIGHT), 15):
-                            # Random characters
-                            char = chr(random.randint(33, 126))
-                            char_alpha = max(0, 255 - (y * 3))
-                            
-                            # Neon green like classic matrix
-                            char_color = (0, 255, 100, char_alpha)
-                            char_surf = pygame.font.Font(None, 24).render(char, True, char_color[:3])
-                            char_surf.set_alpha(char_alpha)
-                            screen.blit(char_surf, (x + random.randint(-5, 5), y))
+                    draw_digital_rain(screen, self.rain_glyphs, progress)
                 
                 # Central growing hexagon
                 if progress > 0.6:
@@ -560,25 +605,47 @@ class Game:
         
         
         # Update display
-        pygame.display.flip()
+        if self.renderer:
+            self.renderer.present()
+        else:
+            pygame.display.flip()
+    
+    def mark(self, rect):
+        """Note a drawn region for the dirty-rect renderer, if it's enabled"""
+        if self.renderer:
+            self.renderer.mark(rect)
+        return rect
     
     def draw_text(self, text, x, y):
-        text_surface = self.font.render(text, True, WHITE)
-        screen.blit(text_surface, (x, y))
+        screen = get_screen()
+        text_surface = text_cache.render(self.font, 36, text, WHITE)
+        return self.mark(screen.blit(text_surface, (x, y)))
+    
+    def draw_number(self, label, number, x, y):
+        """draw_text for a label followed by a number.
+
+        The text is only recomposed when the number changes, from the cached label
+        and the digit strip rather than a font render.
+        """
+        screen = get_screen()
+        shown, surface = self.number_surfaces.get(label, (None, None))
+        if shown != number:
+            label_surface = text_cache.render(self.font, 36, label, WHITE)
+            surface = registry.track(pygame.Surface(
+                (label_surface.get_width() + self.digits.width(number),
+                 max(label_surface.get_height(), self.digits.height)), pygame.SRCALPHA), "fonts")
+            surface.blit(label_surface, (0, 0))
+            self.digits.draw(surface, number, (label_surface.get_width(), 0))
+            self.number_surfaces[label] = (number, surface)
+        return self.mark(screen.blit(surface, (x, y)))
         
     def create_reflection_effect(self, position):
         # Create a small flash effect when bullets reflect off shield
-        for _ in range(5):
-            # Random direction
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            velocity = pygame.math.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            # Use shield color for reflection particles
-            color_index = min(len(self.player.shield_colors) - 1, 
-                             int((self.player.shield_strength / self.player.max_shield) * len(self.player.shield_colors)))
-            color = self.player.shield_colors[color_index]
-            # Create particle
-            particle = FireworkParticle(position, velocity, color)
-            particle.lifetime = 10  # Short lifetime
-            self.all_sprites.add(particle)
-            self.particles.add(particle)
\ No newline at end of file
+        # Use shield color for reflection particles
+        color_index = min(len(self.player.shield_colors) - 1, 
+                         int((self.player.shield_strength / self.player.max_shield) * len(self.player.shield_colors)))
+        color = self.player.shield_colors[color_index]
+        # Five particles in random directions with a short lifetime
+        angles = [random.uniform(0, 2 * math.pi) for _ in range(5)]
+        speeds = [random.uniform(1, 3) for _ in range(5)]
+        self.particles.burst(position, angles, speeds, [color], lifetime=(10, 10))
\ No newline at end of file
@@ -6,7 +6,8 @@ import math
 import json
 import os
 from datetime import datetime
-from constants import WIDTH, HEIGHT, WHITE, BLACK, GREEN, screen
+from constants import WIDTH, HEIGHT, WHITE, BLACK, GREEN
+from fonts import get_font
 
 class HighScoreManager:
     def __init__(self):
@@ -260,11 +261,11 @@ class HighScoreEntry:
         self.draw_floating_particles(surface)
         
         # Create fonts with better sizing
-        title_font = pygame.font.Font(None, 72)
-        score_font = pygame.font.Font(None, 56)
-        instruction_font = pygame.font.Font(None, 36)
-        input_font = pygame.font.Font(None, 48)
-        control_font = pygame.font.Font(None, 28)
+        title_font = get_font(72)
+        score_font = get_font(56)
+        instruction_font = get_font(36)
+        input_font = get_font(48)
+        control_font = get_font(28)
         
         # Draw semi-transparent card background
         card_rect = pygame.Rect(WIDTH//2 - 300, 100, 600, 500)
@@ -4,19 +4,99 @@ Sheera vs Iguanas
 A game where Sheera uses sound waves to defend against Iguanas.
 Main entry point for the game.
 """
-import pygame
+import argparse
+import multiprocessing
 import sys
-from constants import clock, FPS
-from game import Game
-from ui import show_mode_selection
+import threading
+import time
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Sheera vs Iguanas")
+    parser.add_argument("--parallel-audio", nargs="?", const=0, type=int, metavar="WORKERS",
+                        help="synthesize the whole sound bank on a process pool at startup "
+                             "(default: one worker per core) and print per-sound timings")
+    parser.add_argument("--asset-budget-mb", type=float, metavar="MB",
+                        help="memory budget for shared image surfaces before least-recently-used "
+                             "ones are evicted")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print live surface memory by category (sprites, effects, "
+                             "screens, fonts) and font pool counters whenever a round ends")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="time imports, asset loads, sound synthesis and fonts up to the "
+                             "first presented frame and print the breakdown")
+    parser.add_argument("--profile-output", default="startup_profile.json", metavar="PATH",
+                        help="where --profile-startup writes its JSON report "
+                             "(default: startup_profile.json)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="during play, redraw and present only the screen regions that "
+                             "changed instead of the whole frame")
+    return parser.parse_args(argv)
+
+def _report_startup_profile(profiler, loader, path):
+    """Once the first frame is up and everything has loaded, print and save the profile"""
+    profiler.first_frame_event.wait()
+    loader.wait()
+    profiler.stop()
+    print(profiler.format_table())
+    profiler.write_json(path)
+    print(f"Startup profile written to {path}")
+
+def main(argv=None):
+    args = parse_args(argv)
+    from profiling import profiler
+    if args.profile_startup:
+        profiler.start()
+
+    # Only what the mode selection screen needs is imported up front; the game
+    # modules load on the boot thread. Keeping imports out of the top of the file
+    # also keeps audio worker processes, which re-import it, lightweight
+    with profiler.phase("imports"):
+        import pygame
+        from constants import clock, FPS
+        from ui import show_mode_selection
+        from boot import BootLoader
+        import display
+
+    # Open the window (or an offscreen surface with SHEERAROIDS_HEADLESS=1)
+    display.init()
+
+    if args.asset_budget_mb is not None:
+        from registry import registry
+        registry.set_budget(int(args.asset_budget_mb * 1024 * 1024))
+
+    if args.parallel_audio is not None:
+        from game import sounds
+        from soundbank import print_timings
+        start = time.perf_counter()
+        timings = sounds.build_parallel(args.parallel_audio or None)
+        print_timings(timings, time.perf_counter() - start)
+        for name, seconds in timings.items():
+            profiler.record(f"{name} (worker)", seconds)
+
+    loader = BootLoader()
+    loader.start()
+    if args.profile_startup:
+        threading.Thread(target=_report_startup_profile,
+                         args=(profiler, loader, args.profile_output), daemon=True).start()
+
+    game = None
     while True:
+        if args.memory_report and game is not None:
+            from registry import registry
+            from fonts import font_pool
+            print(registry.format_memory_report())
+            print(font_pool.format_stats())
+        
         # Show mode selection screen
-        selected_mode = show_mode_selection()
+        selected_mode = show_mode_selection(loader)
         
-        # Create game with selected mode
-        game = Game(selected_mode)
+        # Create game with selected mode (already imported by the boot loader);
+        # restarts reuse it, keeping its assets, fonts and score data
+        if game is None:
+            from game import Game
+            game = Game(selected_mode, dirty_rects=args.dirty_rects)
+        else:
+            game.reset(selected_mode)
         running = True
         
         while running:
@@ -39,4 +119,5 @@ def main():
                 running = False  # Break out to restart
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()  # Needed for the process pool in frozen builds
+    main()
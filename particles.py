@@ -0,0 +1,146 @@
+"""
+Particle engine: every effect particle lives in a few NumPy arrays
+
+Position, velocity, lifetime, fade, color and size are parallel arrays that are
+integrated in one vectorized step per frame, and drawing is a single blits()
+call of pre-made atlas dot stamps. Nothing is allocated per particle.
+"""
+import math
+import numpy as np
+from atlas import sprite_atlas
+
+GRAVITY = 0.05
+# Default particle lifetime, and the span every particle fades out over whatever
+# its lifetime (so long-lived particles linger dim and short ones vanish bright)
+LIFETIME = (30, 60)
+# Shrinking particles shrink over their last this many frames
+SHRINK_FRAMES = 100
+# Particle alpha is quantized to this many stamp variants per color and size
+ALPHA_LEVELS = 32
+# Initial array size; grows by doubling
+CAPACITY = 1024
+
+class ParticleSystem:
+    """Stands in for the game's particle sprite group: update(), draw(), empty()"""
+    def __init__(self, capacity=CAPACITY, gravity=GRAVITY):
+        self.gravity = gravity
+        self.count = 0
+        self.palette = []       # color index -> RGB tuple
+        self.color_index = {}   # RGB tuple -> color index
+        self.stamps = {}        # (color index, radius, box, alpha level) -> surface
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = getattr(self, "position", None)
+        arrays = {
+            "position": np.zeros((capacity, 2)),
+            "velocity": np.zeros((capacity, 2)),
+            "lifetime": np.zeros(capacity, np.int32),
+            "alpha": np.zeros(capacity),
+            "fade_rate": np.zeros(capacity),
+            "color": np.zeros(capacity, np.int32),
+            "size": np.zeros(capacity, np.int32),
+            "shrink": np.zeros(capacity, bool),
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def _palette_indices(self, colors, count):
+        indices = []
+        for color in colors:
+            color = tuple(color)
+            if color not in self.color_index:
+                self.color_index[color] = len(self.palette)
+                self.palette.append(color)
+            indices.append(self.color_index[color])
+        return np.asarray(indices, np.int32)[np.random.randint(0, len(indices), count)]
+
+    def burst(self, center, angles, speeds, colors, lifetime=LIFETIME, size=3, shrink=False):
+        """Emit one particle per angle/speed pair from center.
+
+        Each particle gets a random color from colors and a lifetime drawn from the
+        inclusive (low, high) range. size is the dot's box side, or with shrink the
+        dot's radius, which then shrinks away over the last SHRINK_FRAMES frames;
+        it may be an int or one value per particle.
+        """
+        angles = np.asarray(angles, float)
+        count = len(angles)
+        if count == 0:
+            return
+        if self.count + count > self.capacity:
+            self._allocate(max(self.capacity * 2, self.count + count))
+        new = slice(self.count, self.count + count)
+        self.position[new] = center
+        self.velocity[new, 0] = np.cos(angles) * speeds
+        self.velocity[new, 1] = np.sin(angles) * speeds
+        self.lifetime[new] = np.random.randint(lifetime[0], lifetime[1] + 1, count)
+        self.alpha[new] = 255
+        self.fade_rate[new] = 255 / np.random.randint(LIFETIME[0], LIFETIME[1] + 1, count)
+        self.color[new] = self._palette_indices(colors, count)
+        self.size[new] = size
+        self.shrink[new] = shrink
+        self.count += count
+
+    def update(self, steps=1):
+        for _ in range(steps):
+            if not self.count:
+                return
+            live = slice(0, self.count)
+            self.velocity[live, 1] += self.gravity
+            self.position[live] += self.velocity[live]
+            self.lifetime[live] -= 1
+            np.maximum(self.alpha[live] - self.fade_rate[live], 0, out=self.alpha[live])
+
+            alive = self.lifetime[live] > 0
+            if not alive.all():
+                kept = int(alive.sum())
+                for array in (self.position, self.velocity, self.lifetime, self.alpha,
+                              self.fade_rate, self.color, self.size, self.shrink):
+                    array[:kept] = array[:self.count][alive]
+                self.count = kept
+
+    def _stamp(self, color, radius, box, level):
+        key = (color, radius, box, level)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            # Own view of the shared atlas dot so its alpha is independent
+            stamp = sprite_atlas.dot(self.palette[color], radius, box)
+            stamp.set_alpha(level * 255 // (ALPHA_LEVELS - 1))
+            self.stamps[key] = stamp
+        return stamp
+
+    def draw(self, surface):
+        """Blit every visible particle; returns the blitted rects like Group.draw"""
+        if not self.count:
+            return []
+        live = slice(0, self.count)
+        lifetime, size, shrink = self.lifetime[live], self.size[live], self.shrink[live]
+        shrunk = np.maximum(1, size * lifetime // SHRINK_FRAMES)
+        radius = np.where(shrink, np.where(lifetime < SHRINK_FRAMES, shrunk, size), size // 2)
+        box = np.where(shrink, radius * 2, size)
+        level = np.rint(self.alpha[live] * ((ALPHA_LEVELS - 1) / 255)).astype(np.int32)
+        topleft = np.rint(self.position[live]).astype(np.int32) - (box // 2)[:, None]
+
+        visible = np.flatnonzero(level > 0)
+        if not len(visible):
+            return []
+        # One stamp lookup per distinct look rather than per particle
+        keys = np.stack((self.color[live], radius, box, level), axis=1)[visible]
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        stamps = [self._stamp(*map(int, key)) for key in unique]
+        return surface.blits([(stamps[i], tuple(position))
+                              for i, position in zip(inverse.ravel().tolist(),
+                                                     topleft[visible].tolist())])
+
+    def empty(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+def radial_angles(count, jitter=0.0):
+    """count evenly spaced directions around a circle, each nudged by up to +/- jitter"""
+    return np.arange(count) * (2 * math.pi / count) + np.random.uniform(-jitter, jitter, count)
@@ -0,0 +1,162 @@
+"""
+Startup profiler: hierarchical wall-clock and memory breakdown of launch phases
+
+Disabled by default, so the phase() hooks spread through the loaders cost next
+to nothing. main.py --profile-startup enables it and writes the report once the
+first frame has been presented.
+"""
+import builtins
+import contextlib
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+
+class Phase:
+    """One timed span; nested phases become its children"""
+    def __init__(self, name, thread_name, start, memory_start):
+        self.name = name
+        self.thread_name = thread_name
+        self.start = start
+        self.end = None
+        self.memory_start = memory_start
+        self.memory_end = memory_start
+        self.peak = memory_start
+        self.children = []
+
+    def to_dict(self, origin):
+        return {
+            "name": self.name,
+            "thread": self.thread_name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "wall_ms": round(((self.end or self.start) - self.start) * 1000, 3),
+            "alloc_kb": round((self.memory_end - self.memory_start) / 1024, 1),
+            "peak_kb": round(self.peak / 1024, 1),
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.origin = None
+        self.roots = []
+        self.first_frame = None
+        self.first_frame_event = threading.Event()
+        self.lock = threading.Lock()
+        self._local = threading.local()
+        self._original_import = None
+
+    def start(self, trace_imports=True):
+        """Start recording; optionally time every first-time top-level import"""
+        self.enabled = True
+        self.origin = time.perf_counter()
+        tracemalloc.start()
+        if trace_imports and self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def stop(self):
+        """Stop recording and restore the import hook"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Only imports that actually load a module are worth a phase; dotted
+        # submodules roll up into their package's import
+        if level or "." in name or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        with self.phase(f"import {name}"):
+            return self._original_import(name, globals, locals, fromlist, level)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def phase(self, name):
+        """Context manager timing a named phase, nested under the current one"""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._phase(name)
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        stack = self._stack()
+        memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        phase = Phase(name, threading.current_thread().name, time.perf_counter(), memory)
+        with self.lock:
+            (stack[-1].children if stack else self.roots).append(phase)
+        stack.append(phase)
+        try:
+            yield phase
+        finally:
+            stack.pop()
+            phase.end = time.perf_counter()
+            if tracemalloc.is_tracing():
+                phase.memory_end, phase.peak = tracemalloc.get_traced_memory()
+
+    def record(self, name, seconds):
+        """Add an already-measured phase (e.g. one timed in a worker process)"""
+        if not self.enabled:
+            return
+        with self._phase(name) as phase:
+            pass
+        phase.start = phase.end - seconds
+
+    def frame_presented(self):
+        """Mark the first presented frame; later calls are ignored"""
+        if self.enabled and self.first_frame is None:
+            self.first_frame = time.perf_counter()
+            self.first_frame_event.set()
+
+    def to_dict(self):
+        end = max([phase.end or phase.start for phase in self.roots] + [self.origin])
+        return {
+            "first_frame_ms": round((self.first_frame - self.origin) * 1000, 3)
+                              if self.first_frame else None,
+            "total_ms": round((end - self.origin) * 1000, 3),
+            "phases": [phase.to_dict(self.origin) for phase in self.roots],
+        }
+
+    def format_table(self, min_ms=1.0):
+        """Render the phase tree as a text table, hiding phases shorter than min_ms"""
+        lines = [f"{'phase':<52}{'thread':<16}{'start ms':>10}{'wall ms':>10}"
+                 f"{'alloc KB':>11}{'peak KB':>10}"]
+
+        def add(node, depth):
+            if node["wall_ms"] < min_ms:
+                return
+            name = ("  " * depth + node["name"])[:51]
+            lines.append(f"{name:<52}{node['thread'][:15]:<16}{node['start_ms']:>10.1f}"
+                         f"{node['wall_ms']:>10.1f}{node['alloc_kb']:>11.1f}{node['peak_kb']:>10.1f}")
+            for child in node["children"]:
+                add(child, depth + 1)
+
+        report = self.to_dict()
+        for node in report["phases"]:
+            add(node, 0)
+        if report["first_frame_ms"] is not None:
+            lines.append(f"first frame presented at {report['first_frame_ms']:.1f} ms")
+        return "\n".join(lines)
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+def profiled(func):
+    """Decorator recording each call of a function as a phase"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profiler.phase(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+# Process-wide profiler used by main.py --profile-startup
+profiler = StartupProfiler()
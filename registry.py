@@ -0,0 +1,138 @@
+"""
+Central registry of shared, display-converted surfaces, and of surface memory
+"""
+import pygame
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from bake import load_baked_image, transform_image
+from assetpack import load_packed_image
+
+# Resident surface memory the registry keeps before evicting least-recently-used entries
+DEFAULT_BUDGET = 64 * 1024 * 1024
+# Categories surface memory is reported under
+CATEGORIES = ("sprites", "effects", "screens", "fonts")
+
+def surface_bytes(surface):
+    """Bytes of pixel data held by a surface"""
+    return surface.get_pitch() * surface.get_height()
+
+def _owner(surface):
+    """The surface that actually owns a (sub)surface's pixels"""
+    while surface.get_parent() is not None:
+        surface = surface.get_parent()
+    return surface
+
+class AssetRegistry:
+    """Hands out shared surfaces keyed by (path, size, rotation, flags).
+
+    Surfaces are loaded once (from the baked cache when possible), converted for
+    the display and reused by every caller. Callers must treat them as read-only.
+    Long-lived surfaces created elsewhere can be registered with track() so that
+    memory_by_category() accounts for them too.
+    """
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = budget
+        self.surfaces = OrderedDict()  # key -> surface, least recently used first
+        self.categories = {}  # key -> category
+        self.tracked = {category: weakref.WeakSet() for category in CATEGORIES}
+        self.bytes_resident = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def get(self, path, size=None, rotation=0, alpha=True, fallback=None,
+            category="sprites", keep=True):
+        """Return the shared surface for an image at the given size and rotation.
+
+        If the image can't be loaded and a fallback surface is given, the variant is
+        derived from the fallback instead; otherwise the load error propagates.
+        With keep=False a missing variant is returned without being cached, for
+        callers that copy the pixels elsewhere (like the sprite atlas).
+        """
+        key = (os.path.abspath(path), tuple(size) if size else None, rotation % 360,
+               "alpha" if alpha else "opaque")
+        with self.lock:
+            surface = self.surfaces.get(key)
+            if surface is not None:
+                self.surfaces.move_to_end(key)
+                self.hits += 1
+                return surface
+
+            self.misses += 1
+            surface = self._load(path, size, rotation, fallback)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            if not keep:
+                return surface
+            self.surfaces[key] = surface
+            self.categories[key] = category
+            self.bytes_resident += surface_bytes(surface)
+            self._evict()
+            return surface
+
+    def _load(self, path, size, rotation, fallback):
+        # Pre-decoded pack first, then a baked copy, then the source image
+        image = load_packed_image(path, size, rotation)
+        if image is None:
+            image = load_baked_image(path, size, rotation)
+        if image is not None:
+            return image
+        try:
+            return transform_image(pygame.image.load(path), size, rotation)
+        except (pygame.error, OSError):
+            if fallback is None:
+                raise
+            return transform_image(fallback, size, rotation)
+
+    def _evict(self):
+        """Drop least-recently-used surfaces until the registry fits its budget"""
+        while self.bytes_resident > self.budget and len(self.surfaces) > 1:
+            key, surface = self.surfaces.popitem(last=False)
+            del self.categories[key]
+            self.bytes_resident -= surface_bytes(surface)
+            self.evictions += 1
+
+    def set_budget(self, budget):
+        with self.lock:
+            self.budget = budget
+            self._evict()
+
+    def clear(self):
+        with self.lock:
+            self.surfaces.clear()
+            self.categories.clear()
+            self.bytes_resident = 0
+
+    def track(self, surface, category):
+        """Count a surface owned elsewhere under a category for as long as it lives"""
+        with self.lock:
+            self.tracked[category].add(surface)
+        return surface
+
+    def memory_by_category(self):
+        """Live pixel bytes per category; subsurfaces count towards the surface owning them"""
+        with self.lock:
+            owners = {}
+            for key, surface in self.surfaces.items():
+                owners.setdefault(id(_owner(surface)), (_owner(surface), self.categories[key]))
+            for category, surfaces in self.tracked.items():
+                for surface in list(surfaces):
+                    owners.setdefault(id(_owner(surface)), (_owner(surface), category))
+        totals = dict.fromkeys(CATEGORIES, 0)
+        for surface, category in owners.values():
+            totals[category] += surface_bytes(surface)
+        return totals
+
+    def format_memory_report(self):
+        totals = self.memory_by_category()
+        lines = [f"{category:<10}{size / 1024:>10.1f} KB" for category, size in totals.items()]
+        lines.append(f"{'total':<10}{sum(totals.values()) / 1024:>10.1f} KB "
+                     f"(cache {self.bytes_resident / 1024:.1f} KB of "
+                     f"{self.budget / 1024:.0f} KB budget)")
+        return "\n".join(lines)
+
+# Shared by every module that loads images
+registry = AssetRegistry()
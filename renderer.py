@@ -0,0 +1,61 @@
+"""
+Dirty-rectangle rendering: erase and present only what changed on screen
+
+Opt-in with main.py --dirty-rects. The game marks every rect it draws; the next
+frame erases those rects instead of clearing the screen, and only the union of
+both frames' rects is sent to the display.
+"""
+import pygame
+from constants import WIDTH, HEIGHT, BLACK
+
+# Fraction of the screen above which a full clear and flip is cheaper than rects
+FULL_REDRAW_THRESHOLD = 0.35
+
+class DirtyRenderer:
+    def __init__(self, background=BLACK, threshold=FULL_REDRAW_THRESHOLD):
+        self.background = background
+        self.threshold = threshold
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.previous = []  # rects drawn last frame
+        self.current = []   # rects drawn this frame
+        self.full_redraw = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def _area(self, rects):
+        # Overlaps are counted twice, which only errs towards a full redraw
+        return sum(rect.width * rect.height for rect in rects)
+
+    def invalidate(self):
+        """Clear and present the whole screen next frame (after another screen drew)"""
+        self.full_redraw = True
+
+    def begin(self, screen):
+        """Erase what the last frame drew"""
+        self.current = []
+        if self.full_redraw or self._area(self.previous) > self.threshold * WIDTH * HEIGHT:
+            screen.fill(self.background)
+            self.full_redraw = True
+        else:
+            for rect in self.previous:
+                screen.fill(self.background, rect)
+
+    def mark(self, rect):
+        """Record a drawn rect (as returned by blit or pygame.draw); returns it"""
+        if rect:
+            rect = rect.clip(self.screen_rect)
+            if rect:
+                self.current.append(rect)
+        return rect
+
+    def present(self):
+        """Update the changed regions, or flip when too much of the screen changed"""
+        dirty = self.previous + self.current
+        if self.full_redraw or self._area(dirty) > self.threshold * WIDTH * HEIGHT:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
+        self.previous = self.current
+        self.full_redraw = False
@@ -4,19 +4,25 @@ Game screens: Purple initials entry and clean high scores display
 import pygame
 import math
 import random
-from constants import WIDTH, HEIGHT, WHITE, BLACK, screen, clock
+import numpy as np
+from constants import WIDTH, HEIGHT, WHITE, BLACK
+from fonts import get_font, text_cache
+from registry import registry
 
 
 class PurpleInitialsScreen:
     """Purple-themed dashboard for entering initials"""
-    def __init__(self, score, typing_sound=None):
+    def __init__(self, score, get_typing_sound=None):
         self.score = score
-        self.typing_sound = typing_sound
+        # Returns the typing sound, or None while it isn't available
+        self.get_typing_sound = get_typing_sound or (lambda: None)
         self.initials = ""
         self.done = False
         self.animation_time = 0
         self.cursor_blink_timer = 0
         self.cursor_visible = True
+        self.static_layer = None  # built on the first draw
+        self.box_surf = None
         
         # Purple color palette
         self.purple_dark = (40, 20, 60)
@@ -38,6 +44,8 @@ class PurpleInitialsScreen:
                 'angle': random.uniform(0, 2 * math.pi),
                 'rotation_speed': random.uniform(-0.05, 0.05)
             })
+        for particle in self.particles:
+            particle['glow'] = self.render_particle_glow(particle['size'])
         
         # Geometric shapes for decoration
         self.shapes = []
@@ -58,8 +66,7 @@ class PurpleInitialsScreen:
             if event.key == pygame.K_BACKSPACE:
                 if len(self.initials) > 0:
                     self.initials = self.initials[:-1]
-                    if self.typing_sound:
-                        self.typing_sound.play()
+                    self.play_typing_sound()
             elif event.key == pygame.K_RETURN:
                 if len(self.initials) == 3:
                     self.done = True
@@ -67,8 +74,12 @@ class PurpleInitialsScreen:
                 # Add character if it's a letter and we have less than 3 initials
                 if event.unicode.isalpha() and len(self.initials) < 3:
                     self.initials += event.unicode.upper()
-                    if self.typing_sound:
-                        self.typing_sound.play()
+                    self.play_typing_sound()
+    
+    def play_typing_sound(self):
+        typing_sound = self.get_typing_sound()
+        if typing_sound:
+            typing_sound.play()
     
     def update(self):
         """Update animation elements"""
@@ -152,16 +163,18 @@ class PurpleInitialsScreen:
             pygame.draw.lines(surface, self.accent_pink, False, 
                             [(cx, cy + corner_size), (cx, cy), (cx + corner_size, cy)], 3)
     
+    def render_particle_glow(self, size):
+        """The glow around a particle, drawn once per particle since its size never changes"""
+        glow_surf = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+        glow_color = (*self.accent_cyan, 100)
+        pygame.draw.circle(glow_surf, glow_color, (int(size * 2), int(size * 2)), int(size * 2))
+        return glow_surf
+    
     def draw_particles(self, surface):
         """Draw floating particles"""
         for particle in self.particles:
-            # Create glowing effect
-            glow_surf = pygame.Surface((particle['size'] * 4, particle['size'] * 4), pygame.SRCALPHA)
-            glow_color = (*self.accent_cyan, 100)
-            pygame.draw.circle(glow_surf, glow_color, 
-                             (int(particle['size'] * 2), int(particle['size'] * 2)), 
-                             int(particle['size'] * 2))
-            surface.blit(glow_surf, (particle['x'] - particle['size'] * 2, particle['y'] - particle['size'] * 2))
+            # Draw glowing effect
+            surface.blit(particle['glow'], (particle['x'] - particle['size'] * 2, particle['y'] - particle['size'] * 2))
             
             # Draw core
             pygame.draw.circle(surface, self.accent_cyan, 
@@ -176,8 +189,8 @@ class PurpleInitialsScreen:
     
     def draw_title(self, surface):
         """Draw the title text"""
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 36)
+        font_large = get_font(72)
+        font_medium = get_font(36)
         
         # Main title with glow
         title_text = "ENTER YOUR INITIALS"
@@ -209,16 +222,16 @@ class PurpleInitialsScreen:
         box_x = WIDTH // 2 - box_width // 2
         box_y = HEIGHT // 2 - box_height // 2
         
-        # Draw box background
-        box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-        pygame.draw.rect(box_surf, (*self.purple_dark, 180), (0, 0, box_width, box_height))
-        pygame.draw.rect(box_surf, self.purple_bright, (0, 0, box_width, box_height), 3)
-        surface.blit(box_surf, (box_x, box_y))
+        # Draw box background (translucent, so it's blended over the moving shapes)
+        if self.box_surf is None:
+            self.box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+            pygame.draw.rect(self.box_surf, (*self.purple_dark, 180), (0, 0, box_width, box_height))
+            pygame.draw.rect(self.box_surf, self.purple_bright, (0, 0, box_width, box_height), 3)
+        surface.blit(self.box_surf, (box_x, box_y))
         
         # Draw initials
-        font_huge = pygame.font.Font(None, 64)
         display_text = self.initials + ('_' if self.cursor_visible and len(self.initials) < 3 else '')
-        text_surf = font_huge.render(display_text, True, self.white)
+        text_surf = text_cache.render(get_font(64), 64, display_text, self.white)
         text_rect = text_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         surface.blit(text_surf, text_rect)
         
@@ -235,7 +248,7 @@ class PurpleInitialsScreen:
     
     def draw_instructions(self, surface):
         """Draw instructions at the bottom"""
-        font_small = pygame.font.Font(None, 28)
+        font_small = get_font(28)
         
         instructions = [
             "Type 3 letters for your initials",
@@ -248,24 +261,38 @@ class PurpleInitialsScreen:
             text_rect = text_surf.get_rect(center=(WIDTH // 2, y_start + i * 30))
             surface.blit(text_surf, text_rect)
     
+    def build_static_layer(self):
+        """Everything that never moves: background, frame, title, score and instructions"""
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        
+        # Draw background
+        self.draw_gradient_background(layer)
+        
+        # Draw dashboard frame
+        self.draw_dashboard_frame(layer)
+        
+        # Draw content
+        self.draw_title(layer)
+        self.draw_instructions(layer)
+        return registry.track(layer, "screens")
+    
     def draw(self, surface):
         """Draw the complete purple initials screen"""
         self.update()
         
-        # Draw background
-        self.draw_gradient_background(surface)
+        # Draw the static layer, built once per screen
+        if self.static_layer is None:
+            self.static_layer = self.build_static_layer()
+        surface.blit(self.static_layer, (0, 0))
         
         # Draw decorative elements
         self.draw_shapes(surface)
         self.draw_particles(surface)
         
-        # Draw dashboard frame
-        self.draw_dashboard_frame(surface)
-        
-        # Draw content
-        self.draw_title(surface)
+        # Draw the input box and cursor
         self.draw_input_box(surface)
-        self.draw_instructions(surface)
 
 
 class CleanHighScoresScreen:
@@ -276,6 +303,8 @@ class CleanHighScoresScreen:
         self.frame = 0
         self.timer = 0  # Timer to track 10 seconds
         self.can_continue = False  # Can press ENTER after 10 seconds
+        self.static_layer = None  # built on the first draw
+        self.player_rows = []  # y positions of rows holding the player's score
         
         # Color palette
         self.bg_color = (20, 10, 40)  # Dark purple background
@@ -284,15 +313,12 @@ class CleanHighScoresScreen:
         self.highlight_color = (255, 100, 200)  # Pink for player's score
         self.text_color = (200, 200, 255)  # Light purple for text
         
-        # Starfield background
-        self.stars = []
-        for _ in range(200):
-            self.stars.append({
-                'x': random.randint(0, WIDTH),
-                'y': random.randint(0, HEIGHT),
-                'brightness': random.randint(50, 255),
-                'twinkle_speed': random.uniform(0.02, 0.05)
-            })
+        # Starfield background, one array entry per star
+        star_count = 200
+        self.star_x = np.random.randint(0, WIDTH + 1, star_count)
+        self.star_y = np.random.randint(0, HEIGHT + 1, star_count)
+        self.star_brightness = np.random.randint(50, 256, star_count).astype(float)
+        self.twinkle_speed = np.random.uniform(0.02, 0.05, star_count)
     
     def update(self):
         """Update animations and timer"""
@@ -304,50 +330,67 @@ class CleanHighScoresScreen:
             self.can_continue = True
         
         # Update star twinkle
-        for star in self.stars:
-            star['brightness'] = 128 + 127 * math.sin(self.frame * star['twinkle_speed'])
+        self.star_brightness = 128 + 127 * np.sin(self.frame * self.twinkle_speed)
+    
+    def prepare_stars(self, glow, covered):
+        """Work out the pixels each star sets, given the static layer it's drawn into.
+
+        A star is a 2x2 block (what a radius 1 circle draws), left out where text
+        covers it and brightened where the title glow is added over it.
+        """
+        offsets = np.array([(-1, -1), (-1, 0), (0, -1), (0, 0)])
+        xs = (self.star_x[:, None] + offsets[:, 0]).ravel()
+        ys = (self.star_y[:, None] + offsets[:, 1]).ravel()
+        stars = np.repeat(np.arange(len(self.star_x)), len(offsets))
+        inside = (xs >= 0) & (xs < WIDTH) & (ys >= 0) & (ys < HEIGHT)
+        xs, ys, stars = xs[inside], ys[inside], stars[inside]
+        shown = ~covered[xs, ys]
+        self.star_pixels = (xs[shown], ys[shown])
+        self.star_index = stars[shown]
+        self.star_glow = glow[xs[shown], ys[shown]].astype(np.int32)
     
     def draw_stars(self, surface):
         """Draw twinkling starfield"""
-        for star in self.stars:
-            brightness = int(star['brightness'])
-            color = (brightness, brightness, brightness)
-            pygame.draw.circle(surface, color, (star['x'], star['y']), 1)
+        brightness = self.star_brightness.astype(np.int32)[self.star_index]
+        colors = np.minimum(255, brightness[:, None] + self.star_glow)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[self.star_pixels] = colors
+        del pixels  # unlocks the surface
     
-    def draw_title(self, surface):
-        """Draw the HIGH SCORES title"""
-        font_title = pygame.font.Font(None, 96)
-        
-        # Draw title with glow effect
+    def draw_title_glow(self, surface):
+        """Draw the glow behind the HIGH SCORES title"""
+        font_title = get_font(96)
         title_text = "HIGH SCORES"
+        glow_surf = font_title.render(title_text, True, self.title_color)
+        glow_rect = glow_surf.get_rect(center=(WIDTH // 2, 100))
         
         # Glow layers
         for offset in range(10, 0, -2):
             glow_alpha = 30 // (offset // 2)
-            glow_surf = font_title.render(title_text, True, self.title_color)
-            glow_rect = glow_surf.get_rect(center=(WIDTH // 2, 100))
-            
             glow_surface = pygame.Surface((glow_surf.get_width() + offset*4, 
                                          glow_surf.get_height() + offset*4), pygame.SRCALPHA)
             glow_surface.fill((*self.title_color, glow_alpha))
             surface.blit(glow_surface, (glow_rect.x - offset*2, glow_rect.y - offset*2), 
                         special_flags=pygame.BLEND_ADD)
-        
-        # Main title
-        title_surf = font_title.render(title_text, True, self.title_color)
+    
+    def draw_title(self, surface):
+        """Draw the HIGH SCORES title"""
+        font_title = get_font(96)
+        title_surf = font_title.render("HIGH SCORES", True, self.title_color)
         title_rect = title_surf.get_rect(center=(WIDTH // 2, 100))
         surface.blit(title_surf, title_rect)
     
     def draw_scores(self, surface):
         """Draw the high scores list"""
-        font_score = pygame.font.Font(None, 48)
-        font_rank = pygame.font.Font(None, 36)
+        font_score = get_font(48)
+        font_rank = get_font(36)
         
         # Starting position for scores
         y_start = 200
         line_height = 45
         
         # Draw top 10 scores
+        self.player_rows = []
         for i, entry in enumerate(self.high_scores[:10]):
             y_pos = y_start + i * line_height
             
@@ -383,45 +426,69 @@ class CleanHighScoresScreen:
             score_rect.y = y_pos - 5
             surface.blit(score_surf, score_rect)
             
-            # Add pulsing effect for player's score
             if is_player_score:
-                pulse = math.sin(self.frame * 0.1) * 0.3 + 0.7
-                overlay = pygame.Surface((WIDTH - 400, line_height), pygame.SRCALPHA)
-                overlay.fill((*self.highlight_color, int(30 * pulse)))
-                surface.blit(overlay, (200, y_pos - 5), special_flags=pygame.BLEND_ADD)
+                self.player_rows.append(y_pos)
+    
+    def draw_highlight(self, surface):
+        """Add the pulsing highlight over the player's score"""
+        pulse = math.sin(self.frame * 0.1) * 0.3 + 0.7
+        strength = 30 * pulse / 255
+        highlight = tuple(int(c * strength) for c in self.highlight_color)
+        for y_pos in self.player_rows:
+            surface.fill(highlight, (200, y_pos - 5, WIDTH - 400, 45), special_flags=pygame.BLEND_ADD)
+    
+    def build_static_layer(self):
+        """Background, title and leaderboard rows, rendered once when the screen opens"""
+        layer = pygame.Surface((WIDTH, HEIGHT))
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.fill(self.bg_color)
+        
+        # The glow is added on its own first so the stars can get it added too
+        glow = pygame.Surface((WIDTH, HEIGHT))
+        self.draw_title_glow(glow)
+        layer.blit(glow, (0, 0), special_flags=pygame.BLEND_ADD)
+        background = pygame.surfarray.array3d(layer)
+        
+        self.draw_title(layer)
+        self.draw_scores(layer)
+        covered = (pygame.surfarray.array3d(layer) != background).any(axis=2)
+        self.prepare_stars(pygame.surfarray.array3d(glow), covered)
+        return registry.track(layer, "screens")
     
     def draw_continue_prompt(self, surface):
         """Draw the continue prompt"""
-        font_prompt = pygame.font.Font(None, 36)
+        font_prompt = get_font(36)
         
         if self.can_continue:
             # Pulsing effect for prompt
             pulse = math.sin(self.frame * 0.05) * 0.3 + 0.7
-            prompt_color = tuple(int(c * pulse) for c in self.text_color)
+            level = int(255 * pulse)
             
+            # One cached render in the full color, dimmed on a copy each frame
             prompt_text = "Press ENTER to play again"
-            prompt_surf = font_prompt.render(prompt_text, True, prompt_color)
+            prompt_surf = text_cache.render(font_prompt, 36, prompt_text, self.text_color).copy()
+            prompt_surf.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
             prompt_rect = prompt_surf.get_rect(center=(WIDTH // 2, HEIGHT - 80))
             surface.blit(prompt_surf, prompt_rect)
         else:
             # Show countdown
             seconds_left = max(0, 10 - self.timer // 60)
             countdown_text = f"Continue in {seconds_left}..."
-            countdown_surf = font_prompt.render(countdown_text, True, self.text_color)
+            countdown_surf = text_cache.render(font_prompt, 36, countdown_text, self.text_color)
             countdown_rect = countdown_surf.get_rect(center=(WIDTH // 2, HEIGHT - 80))
             surface.blit(countdown_surf, countdown_rect)
     
     def draw(self, surface):
         """Draw the complete high scores screen"""
-        # Clear screen
-        surface.fill(self.bg_color)
+        # Background, title and rows are rendered once
+        if self.static_layer is None:
+            self.static_layer = self.build_static_layer()
+        surface.blit(self.static_layer, (0, 0))
         
-        # Draw background
+        # Draw the stars behind the text, and the highlight over it
         self.draw_stars(surface)
-        
-        # Draw content
-        self.draw_title(surface)
-        self.draw_scores(surface)
+        self.draw_highlight(surface)
         self.draw_continue_prompt(surface)
         
         # Update animations
@@ -1,11 +1,19 @@
+import os
 import sys
 from cx_Freeze import setup, Executable
+from assetpack import pack_path
+
+# The runtime images and sounds ship pre-decoded in one pack, written by
+# `python assetpack.py`; the loose assets (including the promo video) aren't shipped
+if not os.path.exists(pack_path):
+    sys.exit(f"{pack_path} is missing; run python assetpack.py before building")
 
 # Dependencies
 build_exe_options = {
     "packages": ["pygame", "numpy"],
     "include_files": [
-        "assets/",  # Include all game assets
+        (pack_path, "assets/runtime.pack"),  # Pre-decoded game assets
+        "assets/bark_shoot_converted.wav",  # Loaded directly if the pack can't provide it
         "constants.py",
         "game.py",
         "ui.py",
@@ -14,7 +22,20 @@ build_exe_options = {
         "audio.py",
         "screens.py",
         "highscores.py",
-        "utils.py"
+        "utils.py",
+        "display.py",
+        "soundcache.py",
+        "soundbank.py",
+        "bake.py",
+        "registry.py",
+        "atlas.py",
+        "frames.py",
+        "assetpack.py",
+        "boot.py",
+        "profiling.py",
+        "renderer.py",
+        "particles.py",
+        "fonts.py"
     ],
     "excludes": ["tkinter", "unittest"],
     "optimize": 2,
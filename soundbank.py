@@ -0,0 +1,235 @@
+"""
+Lazy sound bank with background prewarming
+"""
+import importlib
+import threading
+import time
+import numpy as np
+import pygame
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import resource_tracker, shared_memory
+import audio
+from display import init_mixer
+
+# (name, factory, volume) in prewarm priority order: gameplay effects first,
+# the long music tracks last
+SOUND_SPECS = [
+    ("shoot", audio.load_shoot_sound, None),  # Volume set by the loader
+    ("explosion", audio.create_explosion_sound, 0.7),
+    ("explosion_2", audio.create_explosion_sound_2, 0.8),  # Louder for second explosion
+    ("shield_bounce", audio.create_shield_bounce_sound, 0.6),
+    ("player_death", audio.create_player_death_sound, 0.7),
+    ("particle_shrinking", audio.create_particle_shrinking_sound, 0.7),
+    ("typing", audio.create_typing_sound, 0.5),
+    ("final_death_80s", audio.create_final_death_sound_80s, 0.8),
+    ("death_80s", audio.create_80s_death_sound, 0.6),
+    ("transition_sweep", audio.create_transition_sweep, 0.6),
+    ("wrong_answer", audio.create_wrong_answer_sound, 0.6),
+    ("victory_fanfare", audio.create_victory_fanfare, 0.7),
+    ("transition_music_80s", audio.create_80s_transition_music, 0.5),
+    ("game_over_music", audio.create_game_over_music, 0.4),
+    ("high_scores_music", audio.create_high_scores_music, 0.3),
+]
+
+def _synthesize_to_shared_memory(name, module_name, factory_name, mixer_format):
+    """Process-pool job: render one generator into a new shared memory block"""
+    start = time.perf_counter()
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    samples = factory.render(mixer_format=mixer_format)
+    elapsed = time.perf_counter() - start
+    if samples is None:
+        return name, None, None, None, elapsed
+
+    block = shared_memory.SharedMemory(create=True, size=samples.nbytes)
+    np.ndarray(samples.shape, dtype=samples.dtype, buffer=block.buf)[:] = samples
+    # The block stays registered with the parent's resource tracker, which
+    # removes it if the main process never gets to unlink it
+    block.close()
+    return name, block.name, samples.shape, samples.dtype.str, elapsed
+
+class SoundBank:
+    """Builds each sound on first request and prewarms the rest on a background thread"""
+    def __init__(self, specs=SOUND_SPECS):
+        self.specs = {name: (factory, volume) for name, factory, volume in specs}
+        self.sounds = {}
+        self.pending = [name for name, _, _ in specs]
+        self.building = set()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def _build(self, name):
+        """Run the factory for a sound; failures are stored as None so they aren't retried"""
+        factory, volume = self.specs[name]
+        init_mixer()
+        sound = factory()
+        if sound and volume is not None:
+            sound.set_volume(volume)
+        return sound
+
+    def _claim(self, name):
+        """Take a sound off the queue so exactly one thread builds it"""
+        if name in self.pending:
+            self.pending.remove(name)
+        self.building.add(name)
+
+    def _finish(self, name, sound):
+        with self.condition:
+            self.sounds[name] = sound
+            self.building.discard(name)
+            self.condition.notify_all()
+
+    def get(self, name):
+        """Return a sound if it is ready, otherwise move it to the front of the queue.
+
+        Never blocks on synthesis, so it is safe to call from the game loop.
+        """
+        with self.condition:
+            if name in self.sounds:
+                return self.sounds[name]
+            if name not in self.specs:
+                raise KeyError(f"Unknown sound: {name}")
+            if name in self.pending:
+                self.pending.remove(name)
+                self.pending.insert(0, name)
+        self.prewarm()
+        return None
+
+    def load(self, name):
+        """Return a sound, building it on the calling thread if necessary"""
+        with self.condition:
+            if name not in self.specs:
+                raise KeyError(f"Unknown sound: {name}")
+            while name in self.building:
+                self.condition.wait()
+            if name in self.sounds:
+                return self.sounds[name]
+            self._claim(name)
+        sound = self._build(name)
+        self._finish(name, sound)
+        return sound
+
+    def play(self, name, loops=0):
+        """Play a sound if it is ready; returns the sound or None"""
+        sound = self.get(name)
+        if sound:
+            sound.play(loops)
+        return sound
+
+    def is_ready(self, name):
+        with self.condition:
+            return name in self.sounds
+
+    def prewarm(self):
+        """Start the background thread that builds queued sounds in priority order"""
+        with self.condition:
+            if not self.pending or (self.thread and self.thread.is_alive()):
+                return
+            self.thread = threading.Thread(target=self._prewarm_worker,
+                                           name="sound-prewarm", daemon=True)
+            self.thread.start()
+
+    def _prewarm_worker(self):
+        while True:
+            with self.condition:
+                if not self.pending:
+                    return
+                name = self.pending[0]
+                self._claim(name)
+            self._finish(name, self._build(name))
+
+    def wait(self, names=None, timeout=None):
+        """Block until the given sounds (default: all of them) are built"""
+        names = list(self.specs) if names is None else list(names)
+        # Queue in reverse so the first name ends up at the front
+        for name in reversed(names):
+            self.get(name)
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: all(name in self.sounds for name in names), timeout)
+
+    def build_parallel(self, workers=None):
+        """Synthesize every queued sound on a process pool.
+
+        Workers render PCM and hand it back through shared memory; the main process
+        only wraps the buffers as Sounds. Returns {name: seconds} for each sound.
+        """
+        init_mixer()
+        mixer_format = pygame.mixer.get_init()
+        with self.condition:
+            names = list(self.pending)
+            for name in names:
+                self._claim(name)
+
+        timings = {}
+        remote = [name for name in names if hasattr(self.specs[name][0], "render")]
+        local = [name for name in names if name not in remote]
+        futures = []
+        try:
+            # Workers register their blocks with this tracker, so it must be
+            # running before the pool forks them
+            resource_tracker.ensure_running()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for name in remote:
+                    factory = self.specs[name][0]
+                    futures.append(pool.submit(_synthesize_to_shared_memory, name,
+                                               factory.__module__, factory.__name__,
+                                               mixer_format))
+
+                # Plain file loads stay on this process while the pool works
+                for name in local:
+                    start = time.perf_counter()
+                    self._finish(name, self._build(name))
+                    timings[name] = time.perf_counter() - start
+
+                for future in as_completed(futures):
+                    name, block_name, shape, dtype, elapsed = future.result()
+                    self._finish(name, self._wrap_shared(name, block_name, shape, dtype))
+                    timings[name] = elapsed
+        except Exception as e:
+            print(f"Parallel sound synthesis failed, building the rest here: {e}")
+            # Leaving the pool waited for every job; keep what finished and free its block
+            for future in futures:
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                name, block_name, shape, dtype, elapsed = future.result()
+                if name in self.sounds:
+                    continue
+                try:
+                    self._finish(name, self._wrap_shared(name, block_name, shape, dtype))
+                    timings[name] = elapsed
+                except Exception as e:
+                    print(f"Could not create {name} sound: {e}")
+            for name in names:
+                if name not in self.sounds:
+                    start = time.perf_counter()
+                    self._finish(name, self._build(name))
+                    timings[name] = time.perf_counter() - start
+        return timings
+
+    def _wrap_shared(self, name, block_name, shape, dtype):
+        """Turn a worker's shared memory block into a Sound and release the block"""
+        if block_name is None:
+            return None
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            samples = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+            sound = pygame.sndarray.make_sound(samples)
+            del samples
+        except pygame.error as e:
+            print(f"Could not create {name} sound: {e}")
+            sound = None
+        finally:
+            block.close()
+            block.unlink()
+        volume = self.specs[name][1]
+        if sound and volume is not None:
+            sound.set_volume(volume)
+        return sound
+
+def print_timings(timings, wall_time):
+    """Print a per-sound synthesis timing table"""
+    print(f"{'sound':<24}{'seconds':>10}")
+    for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"{name:<24}{seconds:>10.3f}")
+    print(f"{'total (sum)':<24}{sum(timings.values()):>10.3f}")
+    print(f"{'wall clock':<24}{wall_time:>10.3f}")
@@ -0,0 +1,111 @@
+"""
+On-disk cache of synthesized sound buffers
+"""
+import pygame
+import numpy as np
+import os
+import functools
+import hashlib
+import inspect
+import marshal
+from constants import cache_dir
+from profiling import profiler
+from assetpack import load_packed_samples, synthesized_key
+
+# Bump when the layout or naming of cached sound buffers changes
+SOUND_CACHE_VERSION = 2
+sound_cache_dir = os.path.join(cache_dir, "sounds", f"v{SOUND_CACHE_VERSION}")
+
+def generator_fingerprint(func):
+    """Hash a generator's source so that editing it invalidates its cache entries"""
+    try:
+        source = inspect.getsource(func).encode("utf-8")
+    except (OSError, TypeError):
+        # Frozen builds only ship bytecode
+        source = marshal.dumps(func.__code__)
+    return hashlib.sha1(source).hexdigest()
+
+def _load_cached_samples(path):
+    """Memory-map a cached PCM buffer, or return None if it is missing or unreadable"""
+    try:
+        samples = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if samples.dtype != np.int16 or samples.ndim != 2:
+        return None
+    return samples
+
+def _store_cached_samples(path, samples):
+    """Write a PCM buffer to the cache and drop stale entries for the same sound.
+
+    Entries are named <generator>-<parameters and format>-<source hash>; only
+    entries differing in the source hash are stale; other parameterizations and
+    mixer formats of the generator are left alone.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(samples, dtype=np.int16))
+        os.replace(tmp_path, path)
+
+        prefix = os.path.basename(path).rsplit("-", 1)[0] + "-"  # up to the source hash
+        for entry in os.listdir(os.path.dirname(path)):
+            if entry.startswith(prefix) and entry != os.path.basename(path):
+                os.remove(os.path.join(os.path.dirname(path), entry))
+    except OSError as e:
+        print(f"Could not cache sound buffer {path}: {e}")
+
+def synthesized(func):
+    """Turn a PCM generator into a Sound factory backed by the on-disk sound cache.
+
+    The generator returns an int16 stereo array (or None on failure). Entries are
+    keyed by the generator's source hash, its bound parameters and the mixer format,
+    so only generators that changed are synthesized again.
+    """
+    signature = inspect.signature(func)
+    fingerprint = None
+
+    def render(*args, mixer_format=None, **kwargs):
+        """Return the generator's PCM buffer, from the cache when possible"""
+        nonlocal fingerprint
+        if fingerprint is None:
+            fingerprint = generator_fingerprint(func)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if mixer_format is None:
+            mixer_format = pygame.mixer.get_init()
+
+        key = hashlib.sha1(repr((sorted(bound.arguments.items()),
+                                 mixer_format)).encode("utf-8")).hexdigest()
+        path = os.path.join(sound_cache_dir,
+                            f"{func.__name__}-{key[:16]}-{fingerprint[:16]}.npy")
+
+        with profiler.phase(func.__name__) as phase:
+            # Frozen builds ship every default sound pre-rendered in the asset pack
+            samples = load_packed_samples(
+                synthesized_key(func.__name__, bound.arguments), fingerprint)
+            if samples is None:
+                samples = _load_cached_samples(path)
+            if samples is None:
+                samples = func(*bound.args, **bound.kwargs)
+                if samples is not None:
+                    _store_cached_samples(path, samples)
+            elif phase is not None:
+                phase.name += " (cached)"
+        return samples
+
+    @functools.wraps(func)
+    def create(*args, **kwargs):
+        samples = render(*args, **kwargs)
+        if samples is None:
+            return None
+        try:
+            return pygame.sndarray.make_sound(samples)
+        except pygame.error as e:
+            print(f"Could not create {func.__name__[len('create_'):]}: {e}")
+            return None
+
+    create.render = render
+    create.generator = func
+    return create
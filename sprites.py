@@ -3,12 +3,121 @@ Game sprite classes: Player, Enemies, Projectiles, Effects
 """
 import pygame
 import math
+import os
 import random
-from constants import WIDTH, HEIGHT, WHITE, BLACK
-from utils import load_game_assets
+import threading
+from constants import WIDTH, HEIGHT, WHITE, BLACK, MODE_IMAGES, assets_dir, \
+    ASTEROID_ROTATION_STEP, SHEERA_ROTATION_STEP, SHEERA_SMOOTH_ROTATION, SOUNDWAVE_ROTATION_STEP, \
+    EFFECT_LEVELS, SHIELD_PULSE_PHASES
+from utils import load_game_assets, load_iguana_image
+from registry import registry
+from display import get_screen
+from atlas import sprite_atlas
+from frames import rotation_cache, FrameCache
 
-# Load assets for sprites
-ship_img, bullet_img, explosion_img, asteroid_images = load_game_assets()
+_assets = None
+_soundwave_frames = None
+_assets_lock = threading.RLock()  # the boot loader may be loading on another thread
+
+def get_sprite_assets():
+    """Load sprite images into the atlas on first use, once the display exists"""
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            get_screen()
+            # The atlas keeps its own copy of the pixels, so the registry needn't
+            ship_img, bullet_img, explosion_img, asteroid_images = load_game_assets(keep=False)
+            # Tallest first so the shelves pack tightly
+            images = [("ship", ship_img), ("bullet", bullet_img), ("explosion", explosion_img)]
+            images += [(("iguana", i), image) for i, image in enumerate(asteroid_images)]
+            for key, image in sorted(images, key=lambda item: -item[1].get_height()):
+                sprite_atlas.add(key, image)
+            _assets = (sprite_atlas.get("ship"), sprite_atlas.get("bullet"),
+                       sprite_atlas.get("explosion"),
+                       [sprite_atlas.get(("iguana", i)) for i in range(len(asteroid_images))])
+        return _assets
+
+def get_asteroid_image(size):
+    """Atlas image for an asteroid of size 1-3 (its iguana image scaled by size * 0.3)"""
+    key = ("asteroid", size)
+    with _assets_lock:
+        if key not in sprite_atlas:
+            base_image = get_sprite_assets()[3][3 - size]
+            scale = size * 0.3
+            sprite_atlas.add(key, load_iguana_image((int(base_image.get_width() * scale),
+                                                     int(base_image.get_height() * scale)),
+                                                    keep=False))
+        return sprite_atlas.get(key)
+
+def get_asteroid_rotations(size):
+    """Rotation frames shared by every asteroid of a size"""
+    return rotation_cache(("asteroid", size), get_asteroid_image(size), ASTEROID_ROTATION_STEP)
+
+def get_soundwave_frames():
+    """{pulse scale: rotation frames} of the bullet image, shared by every SoundWave"""
+    global _soundwave_frames
+    with _assets_lock:
+        if _soundwave_frames is None:
+            bullet_img = get_sprite_assets()[1]
+            pulsed = sprite_atlas.add(("bullet", 1.2), pygame.transform.scale(
+                bullet_img, (int(bullet_img.get_width() * 1.2), int(bullet_img.get_height() * 1.2))))
+            _soundwave_frames = {
+                1.0: rotation_cache(("soundwave", 1.0), bullet_img, SOUNDWAVE_ROTATION_STEP),
+                1.2: rotation_cache(("soundwave", 1.2), pulsed, SOUNDWAVE_ROTATION_STEP),
+            }
+        return _soundwave_frames
+
+def get_mode_image(game_mode):
+    """Atlas image of Sheera for a game mode, falling back to the ship image"""
+    key = ("mode", game_mode)
+    with _assets_lock:
+        if key not in sprite_atlas:
+            try:
+                image = registry.get(os.path.join(assets_dir, MODE_IMAGES[game_mode]),
+                                     (60, 60), rotation=90, keep=False)
+            except:
+                return get_sprite_assets()[0]
+            sprite_atlas.add(key, image)
+        return sprite_atlas.get(key)
+
+def _render_glow(glow_size, level, color):
+    heat_percent = level / EFFECT_LEVELS
+    glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+    # Draw multiple glow circles for intensity effect
+    for radius in range(glow_size, glow_size - 10, -1):
+        alpha = int(100 * heat_percent * (radius / glow_size))
+        pygame.draw.circle(glow_surface, (*color, alpha), (glow_size, glow_size), radius, 2)
+    return glow_surface
+
+def _render_shield(shield_size, phase, level, color):
+    shield_percent = level / EFFECT_LEVELS
+    shield_surf = pygame.Surface((shield_size * 2, shield_size * 2), pygame.SRCALPHA)
+    # Enhanced pulsating effect
+    pulse = math.sin(phase * 2 * math.pi / SHIELD_PULSE_PHASES) * 0.15 + 0.95
+    
+    # Draw multiple layers for a more vibrant effect
+    for i in range(3):
+        layer_radius = shield_size - (i * 3)
+        if layer_radius > 0:
+            adjusted_radius = int(layer_radius * pulse)
+            # Higher alpha for more vibrance
+            alpha = int(200 * shield_percent)
+            # Slightly different color for each layer
+            layer_color = list(color)
+            layer_color[i % 3] = min(255, layer_color[i % 3] + 30)
+            # Thicker lines for more visibility
+            thickness = 3 if i == 0 else 2
+            pygame.draw.circle(shield_surf, (*layer_color, alpha), (shield_size, shield_size),
+                               adjusted_radius, thickness)
+    
+    # Add a bright glow in the center
+    glow_radius = int(shield_size * 0.8 * pulse)
+    pygame.draw.circle(shield_surf, (*color, 50), (shield_size, shield_size), glow_radius, 0)
+    return shield_surf
+
+# Shared by every game: (size, heat level, color) and (size, pulse phase, strength level, color)
+glow_frames = FrameCache(_render_glow, 8 * 1024 * 1024, rle=True)
+shield_frames = FrameCache(_render_shield, 16 * 1024 * 1024)
 
 class MotionTrail(pygame.sprite.Sprite):
     def __init__(self, image, position, alpha=150):
@@ -31,28 +140,22 @@ class MotionTrail(pygame.sprite.Sprite):
 class Sheera(pygame.sprite.Sprite):
     def __init__(self, game_mode="normal"):
         pygame.sprite.Sprite.__init__(self)
+        self.reset(game_mode)
+
+    def reset(self, game_mode="normal"):
+        """Put Sheera back in her starting state; reused by warm restarts"""
         # Load different image based on game mode
-        if game_mode == "accelerated":
-            try:
-                import os
-                from constants import assets_dir
-                mode_img = pygame.image.load(os.path.join(assets_dir, "ChatGPT Image Jun 12, 2025, 07_17_20 PM.png"))
-                scaled_img = pygame.transform.scale(mode_img, (60, 60))
-                self.image = pygame.transform.rotate(scaled_img, 90)
-            except:
-                self.image = ship_img
-        elif game_mode == "slowed":
-            try:
-                import os
-                from constants import assets_dir
-                mode_img = pygame.image.load(os.path.join(assets_dir, "Generated Image June 12, 2025 - 7_16PM.png"))
-                scaled_img = pygame.transform.scale(mode_img, (60, 60))
-                self.image = pygame.transform.rotate(scaled_img, 90)
-            except:
-                self.image = ship_img
+        if game_mode in MODE_IMAGES:
+            self.image = get_mode_image(game_mode)
+            rotation_key = ("sheera", game_mode)
         else:
-            self.image = ship_img
+            self.image = get_sprite_assets()[0]
+            rotation_key = ("sheera", "ship")
         self.original_image = self.image
+        # Each frame is rendered the first time its angle bucket is reached
+        self.rotations = rotation_cache(rotation_key, self.original_image,
+                                        SHEERA_ROTATION_STEP, SHEERA_SMOOTH_ROTATION)
+        self.rotation_index = self.rotations.index(0)
         self.rect = self.image.get_rect()
         self.rect.center = (WIDTH // 2, HEIGHT // 2)
         self.position = pygame.math.Vector2(self.rect.center)
@@ -163,9 +266,12 @@ class Sheera(pygame.sprite.Sprite):
         # Cool down heat
         self.heat = max(0, self.heat - self.heat_cooldown)
         
-        # Rotate ship image
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        # Rotate ship image, only when the angle moves into another frame
+        rotation_index = self.rotations.index(self.angle)
+        if rotation_index != self.rotation_index:
+            self.rotation_index = rotation_index
+            self.image = self.rotations.frame(rotation_index)
+            self.rect = self.image.get_rect(center=self.rect.center)
     
     def shoot(self):
         now = pygame.time.get_ticks()
@@ -189,69 +295,54 @@ class Sheera(pygame.sprite.Sprite):
         return None
         
     def draw_glow(self):
-        from constants import screen
+        screen = get_screen()
         # Calculate bark intensity parameters based on heat
         heat_percent = self.heat / self.max_heat
-        glow_size = int(self.rect.width * (1 + heat_percent * 0.8))
+        # Sized from the unrotated ship and the heat level, so the frames can be cached
+        level = int(heat_percent * EFFECT_LEVELS)
+        glow_size = int(self.original_image.get_width() * (1 + level / EFFECT_LEVELS * 0.8))
         
         # Choose color based on bark intensity level
         color_index = min(len(self.glow_colors) - 1, int(heat_percent * len(self.glow_colors)))
         color = self.glow_colors[color_index]
         
-        # Create bark visualization surface
-        glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-        
-        # Draw multiple glow circles for intensity effect
-        for radius in range(glow_size, glow_size - 10, -1):
-            alpha = int(100 * heat_percent * (radius / glow_size))
-            glow_color = (*color, alpha)
-            pygame.draw.circle(glow_surface, glow_color, (glow_size, glow_size), radius, 2)
-        
-        # Draw the glow on the screen
+        # Draw the cached bark visualization on the screen
+        glow_surface = glow_frames.get(glow_size, level, color)
         glow_rect = glow_surface.get_rect(center=self.rect.center)
-        screen.blit(glow_surface, glow_rect.topleft)
+        return screen.blit(glow_surface, glow_rect.topleft)
+    
+    def shield_level(self):
+        """Shield strength quantized to one of the cached frame levels"""
+        return int(self.shield_strength / self.max_shield * EFFECT_LEVELS)
+    
+    def shield_radius(self):
+        """Radius of the shield as drawn, which is also the radius it collides at.
+
+        Sized from the unrotated ship and the strength level, so the frames can be cached.
+        """
+        return int(self.original_image.get_width() * (1.5 + self.shield_level() / EFFECT_LEVELS))
     
     def draw_shield(self):
-        from constants import screen
+        screen = get_screen()
         if not self.shield_active:
             return
             
         shield_percent = self.shield_strength / self.max_shield
-        shield_size = int(self.rect.width * (1.5 + shield_percent))
+        level = self.shield_level()
+        shield_size = self.shield_radius()
         
         # Choose color based on shield strength
         color_index = min(len(self.shield_colors) - 1, int(shield_percent * len(self.shield_colors)))
         color = self.shield_colors[color_index]
         
-        # Create shield surface
-        shield_surf = pygame.Surface((shield_size * 2, shield_size * 2), pygame.SRCALPHA)
+        # Pulse phase of the shield's sine, in one of the cached steps
+        phase = int(pygame.time.get_ticks() * 0.015 / (2 * math.pi) * SHIELD_PULSE_PHASES) \
+            % SHIELD_PULSE_PHASES
         
-        # Draw shield as a circle with enhanced pulsating effect
-        pulse = math.sin(pygame.time.get_ticks() * 0.015) * 0.15 + 0.95
-        
-        # Draw multiple layers for a more vibrant effect
-        for i in range(3):
-            layer_radius = shield_size - (i * 3)
-            if layer_radius > 0:
-                adjusted_radius = int(layer_radius * pulse)
-                # Higher alpha for more vibrance
-                alpha = int(200 * shield_percent)
-                # Slightly different color for each layer
-                layer_color = list(color)
-                layer_color[i % 3] = min(255, layer_color[i % 3] + 30)
-                shield_color = (*layer_color, alpha)
-                # Thicker lines for more visibility
-                thickness = 3 if i == 0 else 2
-                pygame.draw.circle(shield_surf, shield_color, (shield_size, shield_size), adjusted_radius, thickness)
-        
-        # Add a bright glow in the center
-        glow_radius = int(shield_size * 0.8 * pulse)
-        glow_color = (*color, 50)  # Semi-transparent
-        pygame.draw.circle(shield_surf, glow_color, (shield_size, shield_size), glow_radius, 0)
-        
-        # Draw the shield on the screen
+        # Draw the cached shield on the screen
+        shield_surf = shield_frames.get(shield_size, phase, level, color)
         shield_rect = shield_surf.get_rect(center=self.rect.center)
-        screen.blit(shield_surf, shield_rect.topleft)
+        return screen.blit(shield_surf, shield_rect.topleft)
     
     def hide(self):
         self.hidden = True
@@ -275,12 +366,14 @@ class Sheera(pygame.sprite.Sprite):
 class Asteroid(pygame.sprite.Sprite):
     def __init__(self, size=3):
         pygame.sprite.Sprite.__init__(self)
+        self.pooled = False
+        self.spawn(size)
+
+    def spawn(self, size=3):
+        """(Re)initialize as a fresh asteroid at a random screen edge; reused by the pool"""
         self.size = size
-        self.image = asteroid_images[3 - self.size]
-        scale = self.size * 0.3
-        self.image = pygame.transform.scale(self.image, 
-                                           (int(self.image.get_width() * scale),
-                                            int(self.image.get_height() * scale)))
+        # Shared through the sprite atlas, so only the first asteroid of a size scales
+        self.image = get_asteroid_image(self.size)
         self.rect = self.image.get_rect()
         
         # Spawn at edge of screen
@@ -309,13 +402,14 @@ class Asteroid(pygame.sprite.Sprite):
         self.rotation = 0
         self.rotation_speed = random.uniform(-3, 3)
         self.original_image = self.image
+        self.rotations = get_asteroid_rotations(self.size)
         self.trail_timer = 0
     
     def update(self):
         # Rotate asteroid
         self.rotation = (self.rotation + self.rotation_speed) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.rotation)
-        self.rect = self.image.get_rect(center=self.rect.center)
+        self.image = self.rotations.get(self.rotation)
+        self.rect.size = self.image.get_size()  # recentred on the position below
         
         # Update position
         self.position += self.velocity
@@ -337,20 +431,45 @@ class Asteroid(pygame.sprite.Sprite):
         new_asteroids = []
         if self.size > 1:
             for _ in range(2):
-                new_asteroid = Asteroid(self.size - 1)
+                new_asteroid = asteroid_pool.acquire(self.size - 1)
                 # Random velocity for new pieces
                 angle = random.uniform(0, 2 * math.pi)
                 speed = random.uniform(1, 3)
-                new_asteroid.velocity = pygame.math.Vector2(
-                    math.cos(angle) * speed, math.sin(angle) * speed
-                )
+                new_asteroid.velocity.update(math.cos(angle) * speed, math.sin(angle) * speed)
                 new_asteroids.append(new_asteroid)
         return new_asteroids
 
+class AsteroidPool:
+    """Recycles destroyed asteroids so spawning and splitting don't build new sprites"""
+    def __init__(self):
+        self.free = []
+
+    def acquire(self, size=3):
+        if self.free:
+            asteroid = self.free.pop()
+            asteroid.pooled = False
+            asteroid.spawn(size)
+            return asteroid
+        return Asteroid(size)
+
+    def release(self, asteroid):
+        """Take an asteroid out of play and keep it for reuse"""
+        asteroid.kill()
+        if not asteroid.pooled:
+            asteroid.pooled = True
+            self.free.append(asteroid)
+
+    def prefill(self, count):
+        while len(self.free) < count:
+            self.release(Asteroid())
+
+# Shared by the game and by Asteroid.split
+asteroid_pool = AsteroidPool()
+
 class SoundWave(pygame.sprite.Sprite):
     def __init__(self, x, y, dx, dy):
         pygame.sprite.Sprite.__init__(self)
-        self.image = bullet_img
+        self.image = get_sprite_assets()[1]
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         self.position = pygame.math.Vector2(self.rect.center)
@@ -359,7 +478,10 @@ class SoundWave(pygame.sprite.Sprite):
         self.lifetime = 3000
         self.original_image = self.image
         self.angle = math.degrees(math.atan2(-dy, dx)) - 90
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        # The angle never changes, so every pulse state comes from the same baked frame
+        self.frames = get_soundwave_frames()
+        self.rotation_index = self.frames[1.0].index(self.angle)
+        self.image = self.frames[1.0].frame(self.rotation_index)
         self.rect = self.image.get_rect(center=self.rect.center)
         self.pulse_timer = 0
         self.pulse_rate = 100
@@ -374,56 +496,14 @@ class SoundWave(pygame.sprite.Sprite):
         now = pygame.time.get_ticks()
         if now - self.pulse_timer > self.pulse_rate:
             self.pulse_timer = now
-            # Scale bullet for sound wave effect
-            if self.lifetime > 2000:
-                scale = 1.2
-                self.image = pygame.transform.scale(self.original_image, 
-                                                  (int(self.original_image.get_width() * scale),
-                                                   int(self.original_image.get_height() * scale)))
-            else:
-                self.image = self.original_image
-            # Maintain rotation
-            self.image = pygame.transform.rotate(self.image, self.angle)
-            self.rect = self.image.get_rect(center=self.position)
+            # Scale bullet for sound wave effect, keeping its rotation
+            scale = 1.2 if self.lifetime > 2000 else 1.0
+            self.image = self.frames[scale].frame(self.rotation_index)
+            self.rect.size = self.image.get_size()
+            self.rect.center = self.position
         
         # Check if sound wave is off screen or expired
         if (now - self.spawn_time > self.lifetime or
             self.rect.right < 0 or self.rect.left > WIDTH or
             self.rect.bottom < 0 or self.rect.top > HEIGHT):
             self.kill()
-
-class FireworkParticle(pygame.sprite.Sprite):
-    def __init__(self, pos, velocity, color):
-        pygame.sprite.Sprite.__init__(self)
-        self.size = 3
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (self.size//2, self.size//2), self.size//2)
-        self.rect = self.image.get_rect()
-        self.rect.center = pos
-        self.position = pygame.math.Vector2(pos)
-        self.velocity = velocity
-        self.gravity = pygame.math.Vector2(0, 0.05)
-        self.lifetime = random.randint(30, 60)
-        self.alpha = 255
-        self.fade_rate = 255 / self.lifetime
-        
-    def update(self):
-        self.velocity += self.gravity
-        self.position += self.velocity
-        self.rect.center = self.position
-        self.lifetime -= 1
-        if self.lifetime <= 0:
-            self.kill()
-        else:
-            self.alpha = max(0, self.alpha - self.fade_rate)
-            self.image.set_alpha(int(self.alpha))
-            
-            # Shrinking effect for final death particles
-            if self.lifetime < 100:  # Start shrinking in last 100 frames
-                shrink_factor = self.lifetime / 100.0
-                new_size = max(1, int(self.size * shrink_factor))
-                if new_size != self.rect.width // 2:  # Only recreate if size changed
-                    color = self.image.get_at((self.rect.width // 2, self.rect.height // 2))[:3]
-                    self.image = pygame.Surface((new_size * 2, new_size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(self.image, color, (new_size, new_size), new_size)
-                    self.rect = self.image.get_rect(center=self.position)
\ No newline at end of file
@@ -4,7 +4,9 @@ User interface components: Sliders, High Score screens, Mode Selection
 import pygame
 import math
 import random
-from constants import WIDTH, HEIGHT, WHITE, BLACK, screen
+from constants import WIDTH, HEIGHT, WHITE, BLACK
+from fonts import get_font
+from display import get_screen
 
 class SpeedScaleSlider:
     def __init__(self):
@@ -69,7 +71,7 @@ class SpeedScaleSlider:
         
         # Draw scale value text
         scale_value = self.get_scale_multiplier()
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         
         # Title
         title_text = font.render("Speed Scale", True, (255, 255, 255))
@@ -80,7 +82,7 @@ class SpeedScaleSlider:
         surface.blit(value_text, (self.x - 5, self.y + self.height + 10))
         
         # Show what this means for fragment scaling
-        small_font = pygame.font.Font(None, 18)
+        small_font = get_font(18)
         # Calculate what medium speed fragments will be
         medium_scale = 1.0 + ((1.0 + (0.5 * 3.0) - 1.0) * scale_value)  # 0.5 normalized speed
         fast_scale = 1.0 + ((1.0 + (1.0 * 3.0) - 1.0) * scale_value)     # 1.0 normalized speed
@@ -92,7 +94,7 @@ class SpeedScaleSlider:
         surface.blit(fast_text, (self.x - 5, self.y + self.height + 55))
         
         # Scale markers
-        small_font = pygame.font.Font(None, 20)
+        small_font = get_font(20)
         # Top (100x)
         top_text = small_font.render("100x", True, (150, 150, 150))
         surface.blit(top_text, (self.x + self.width + 5, self.y - 5))
@@ -105,34 +107,67 @@ class SpeedScaleSlider:
         bottom_text = small_font.render("0.1x", True, (150, 150, 150))
         surface.blit(bottom_text, (self.x + self.width + 5, self.y + self.height - 10))
 
-def show_mode_selection():
-    """Display mode selection screen and return the selected mode"""
+def _mode_card_placeholders():
+    mode1_img = pygame.Surface((300, 300))
+    mode1_img.fill((255, 100, 100))
+    mode2_img = pygame.Surface((300, 300))
+    mode2_img.fill((100, 100, 255))
+    return mode1_img, mode2_img
+
+def draw_loading_bar(screen, font, fraction, label):
+    """Thin progress bar along the bottom of the screen"""
+    bar = pygame.Rect(WIDTH // 4, HEIGHT - 60, WIDTH // 2, 8)
+    pygame.draw.rect(screen, (60, 60, 60), bar, 1)
+    pygame.draw.rect(screen, (100, 200, 255),
+                     (bar.x, bar.y, int(bar.width * min(1.0, fraction)), bar.height))
+    text = font.render(f"Loading {label}... {int(fraction * 100)}%", True, (150, 150, 150))
+    screen.blit(text, text.get_rect(center=(WIDTH // 2, bar.y - 14)))
+
+def show_mode_selection(loader=None):
+    """Display mode selection screen and return the selected mode.
+
+    With a BootLoader the screen comes up straight away, shows loading progress,
+    and only returns once the chosen mode has what it needs.
+    """
     from constants import clock
     import os
-    from constants import assets_dir
+    from constants import assets_dir, MODE_IMAGES
+    from profiling import profiler
     
-    # Load mode selection images
-    try:
-        mode1_img = pygame.image.load(os.path.join(assets_dir, "ChatGPT Image Jun 12, 2025, 07_17_20 PM.png"))
-        mode2_img = pygame.image.load(os.path.join(assets_dir, "Generated Image June 12, 2025 - 7_16PM.png"))
-        # Scale images to reasonable size
-        mode1_img = pygame.transform.scale(mode1_img, (300, 300))
-        mode2_img = pygame.transform.scale(mode2_img, (300, 300))
-    except:
-        # Fallback if images can't be loaded
-        mode1_img = pygame.Surface((300, 300))
-        mode1_img.fill((255, 100, 100))
-        mode2_img = pygame.Surface((300, 300))
-        mode2_img.fill((100, 100, 255))
+    screen = get_screen()
     
-    font_title = pygame.font.Font(None, 64)
-    font_subtitle = pygame.font.Font(None, 36)
-    font_instruction = pygame.font.Font(None, 24)
+    if loader is None:
+        # Load mode selection images, scaled to a reasonable size (shared across restarts)
+        from registry import registry
+        with profiler.phase("mode selection images"):
+            try:
+                mode1_img = registry.get(os.path.join(assets_dir, MODE_IMAGES["accelerated"]), (300, 300),
+                                         category="screens")
+                mode2_img = registry.get(os.path.join(assets_dir, MODE_IMAGES["slowed"]), (300, 300),
+                                         category="screens")
+            except:
+                # Fallback if images can't be loaded
+                mode1_img, mode2_img = _mode_card_placeholders()
+        cards_loaded = True
+    else:
+        # Placeholders until the loader has the real cards
+        mode1_img, mode2_img = _mode_card_placeholders()
+        cards_loaded = False
+    
+    with profiler.phase("fonts"):
+        font_title = get_font(64)
+        font_subtitle = get_font(36)
+        font_instruction = get_font(24)
     
     selecting = True
     selected_mode = None
     
-    while selecting:
+    while selecting or (loader is not None and not loader.ready(loader.requirements(selected_mode))):
+        if not cards_loaded and loader.ready(["mode cards"]):
+            mode1_img = loader.mode_cards.get("accelerated") or mode1_img
+            mode2_img = loader.mode_cards.get("slowed") or mode2_img
+            cards_loaded = True
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -191,7 +226,14 @@ def show_mode_selection():
         inst_rect = inst_text.get_rect(center=(WIDTH//2, 150))
         screen.blit(inst_text, inst_rect)
         
+        if loader is not None and not loader.finished():
+            fraction, label = loader.progress()
+            if not selecting:
+                label = f"{selected_mode.upper()} mode"
+            draw_loading_bar(screen, font_instruction, fraction, label)
+        
         pygame.display.flip()
+        profiler.frame_presented()
         clock.tick(30)
     
     return selected_mode
\ No newline at end of file
@@ -3,39 +3,59 @@ Utility functions for image loading and asset management
 """
 import pygame
 import os
+import sys
 import numpy as np
 from constants import assets_dir, WIDTH, HEIGHT, BLACK, RED
+from registry import registry
+from assetpack import load_packed_image
+from profiling import profiled
 
-def load_image(name, size=None, convert_alpha=True):
-    """Load an image with optional scaling"""
+# Source image for the iguana enemies
+iguana_path = os.path.join(assets_dir, "iguana2.png")
+_iguana_placeholder = None
+
+def load_image(name, size=None, convert_alpha=True, keep=True):
+    """Load a shared image with optional scaling (keep=False: don't cache it)"""
     try:
-        image = pygame.image.load(name)
-        if convert_alpha:
-            image = image.convert_alpha()
-        else:
-            image = image.convert()
-        if size:
-            image = pygame.transform.scale(image, size)
-        return image
-    except pygame.error:
+        return registry.get(name, size, alpha=convert_alpha, keep=keep)
+    except (pygame.error, FileNotFoundError):
         print(f"Cannot load image: {name}")
         return pygame.Surface((30, 30))
 
+def load_iguana_image(size, keep=True):
+    """Load the shared iguana image at a size, drawing a placeholder if it's missing"""
+    global _iguana_placeholder
+    if _iguana_placeholder is None:
+        _iguana_placeholder = pygame.Surface((60, 60), pygame.SRCALPHA)
+        pygame.draw.polygon(_iguana_placeholder, (0, 200, 0), [(10, 30), (50, 10), (50, 50)])
+    return registry.get(iguana_path, size, fallback=_iguana_placeholder, keep=keep)
+
 def create_placeholder_image(filename, color, size):
-    """Create a placeholder image if asset doesn't exist"""
+    """Create a placeholder image if asset doesn't exist.
+
+    Frozen builds never write one: the install directory may be read-only, and
+    their images come from the asset pack.
+    """
     filepath = os.path.join(assets_dir, filename)
-    if not os.path.exists(filepath):
-        surface = pygame.Surface(size, pygame.SRCALPHA)
-        surface.fill(color)
+    if getattr(sys, "frozen", False) or os.path.exists(filepath):
+        return
+    if load_packed_image(filepath) is not None:
+        return
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    try:
         pygame.image.save(surface, filepath)
+    except (pygame.error, OSError) as e:
+        print(f"Could not create placeholder {filename}: {e}")
 
 def ensure_assets_directory():
-    """Create assets directory if it doesn't exist"""
-    if not os.path.exists(assets_dir):
+    """Create assets directory if it doesn't exist (not in frozen builds)"""
+    if not getattr(sys, "frozen", False) and not os.path.exists(assets_dir):
         os.makedirs(assets_dir)
 
-def load_game_assets():
-    """Load all game assets"""
+@profiled
+def load_game_assets(keep=True):
+    """Load all game assets; with keep=False they aren't kept in the registry"""
     ensure_assets_directory()
     
     # Create placeholder images if they don't exist
@@ -44,22 +64,15 @@ def load_game_assets():
     create_placeholder_image("explosion.png", RED, (50, 50))
 
     # Load game assets
-    ship_img = load_image(os.path.join(assets_dir, "GS1.png"), (120, 90))
-    bullet_img = load_image(os.path.join(assets_dir, "bullet.png"))
-    explosion_img = load_image(os.path.join(assets_dir, "explosion.png"))
-
-    # Load iguana image and create different sizes
-    iguana_original = load_image(os.path.join(assets_dir, "iguana2.png"))
-    if iguana_original.get_width() == 30:  # Default surface when image not found
-        # Create a placeholder iguana image if not found
-        iguana_surface = pygame.Surface((60, 60), pygame.SRCALPHA)
-        pygame.draw.polygon(iguana_surface, (0, 200, 0), [(10, 30), (50, 10), (50, 50)])
-        iguana_original = iguana_surface
+    ship_img = load_image(os.path.join(assets_dir, "GS1.png"), (120, 90), keep=keep)
+    bullet_img = load_image(os.path.join(assets_dir, "bullet.png"), keep=keep)
+    explosion_img = load_image(os.path.join(assets_dir, "explosion.png"), keep=keep)
 
+    # Load iguana image in different sizes
     asteroid_images = [
-        pygame.transform.scale(iguana_original, (90, 90)),  # Large
-        pygame.transform.scale(iguana_original, (70, 70)),  # Medium
-        pygame.transform.scale(iguana_original, (50, 50))   # Small
+        load_iguana_image((90, 90), keep),  # Large
+        load_iguana_image((70, 70), keep),  # Medium
+        load_iguana_image((50, 50), keep)   # Small
     ]
     
     return ship_img, bullet_img, explosion_img, asteroid_images
\ No newline at end of file